@@ -6,17 +6,101 @@ Issue #53: Migration Tooling and Scripts
 """
 
 import argparse
+import functools
+import io
 import logging
 import os
+import re
 from datetime import datetime
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, FrozenSet, Iterator, Tuple
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 
+# Valid environment variable names (compiled once, shared by every loaded file)
+_ENV_NAME_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z")
+
+# Environment variable mapping from old to new format
+ENV_MAPPING = {
+    # Service configuration
+    "CHANGE_DETECTOR_MODE": "PROCESSOR_MODE",
+    "DETECTOR_RUN_MODE": "RUN_MODE",
+    "DETECTOR_SERVICE_INTERVAL": "SERVICE_INTERVAL",
+    # Data storage
+    "CHANGE_DETECTOR_DATA_FOLDER": "DATA_FOLDER",
+    "DETECTOR_PREVIOUS_MATCHES_FILE": "PREVIOUS_MATCHES_FILE",
+    "DETECTOR_TEMP_DIRECTORY": "TEMP_FILE_DIRECTORY",
+    # Service URLs (these should remain the same but validate)
+    "FOGIS_API_CLIENT_URL": "FOGIS_API_CLIENT_URL",
+    "WHATSAPP_AVATAR_SERVICE_URL": "WHATSAPP_AVATAR_SERVICE_URL",
+    "GOOGLE_DRIVE_SERVICE_URL": "GOOGLE_DRIVE_SERVICE_URL",
+    "PHONEBOOK_SYNC_SERVICE_URL": "PHONEBOOK_SYNC_SERVICE_URL",
+    # Processing settings
+    "MIN_REFEREES_FOR_WHATSAPP": "MIN_REFEREES_FOR_WHATSAPP",
+    "GDRIVE_FOLDER_BASE": "GDRIVE_FOLDER_BASE",
+    # Logging
+    "LOG_LEVEL": "LOG_LEVEL",
+    "LOG_FORMAT": "LOG_FORMAT",
+    # Health check
+    "HEALTH_SERVER_PORT": "HEALTH_SERVER_PORT",
+    "HEALTH_SERVER_HOST": "HEALTH_SERVER_HOST",
+}
+
+# Default values for new unified processor
+DEFAULT_VALUES = {
+    "PROCESSOR_MODE": "unified",
+    "RUN_MODE": "service",
+    "SERVICE_INTERVAL": "3600",
+    "ENABLE_CHANGE_CATEGORIZATION": "true",
+    "CHANGE_PRIORITY_SAME_DAY": "critical",
+    "ENABLE_SEMANTIC_ANALYSIS": "true",
+    "FALLBACK_TO_LEGACY": "true",
+    "ENABLE_DELIVERY_MONITORING": "true",
+    "TZ": "Europe/Stockholm",
+}
+
+# Values to remove (no longer needed)
+DEPRECATED_VALUES = frozenset(
+    {
+        "WEBHOOK_URL",
+        "WEBHOOK_SECRET",
+        "WEBHOOK_ENABLED",
+        "CHANGE_DETECTOR_WEBHOOK_PORT",
+        "DETECTOR_WEBHOOK_HOST",
+    }
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _plan_migration(
+    keys: Tuple[str, ...],
+    env_mapping: Tuple[Tuple[str, str], ...],
+    default_keys: Tuple[str, ...],
+    deprecated_values: FrozenSet[str],
+) -> Tuple[Tuple[Tuple[str, str], ...], Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """Partition a key set into mapped, preserved, defaulted and deprecated keys.
+
+    The plan depends only on the variable names and the migration rules, so files sharing
+    a schema reuse it. Keys are passed in file order so preserved variables keep their
+    original ordering.
+    """
+    key_set = frozenset(keys)
+    mapped = tuple((old_key, new_key) for old_key, new_key in env_mapping if old_key in key_set)
+    mapped_keys = frozenset(old_key for old_key, _ in env_mapping)
+    preserved = tuple(
+        key for key in keys if key not in mapped_keys and key not in deprecated_values
+    )
+    present = {new_key for _, new_key in mapped}.union(preserved)
+    # PROCESSOR_MODE is always overridden with the unified default
+    defaulted = tuple(key for key in default_keys if key not in present or key == "PROCESSOR_MODE")
+    deprecated = tuple(deprecated_values & key_set)
+    return mapped, preserved, defaulted, deprecated
+
+
 class ConfigurationMigrator:
     """Migrates configuration from old service to new unified processor."""
 
@@ -24,53 +108,16 @@ class ConfigurationMigrator:
         self.backup_dir = Path(backup_dir)
         self.migration_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
-        # Environment variable mapping from old to new format
-        self.env_mapping = {
-            # Service configuration
-            "CHANGE_DETECTOR_MODE": "PROCESSOR_MODE",
-            "DETECTOR_RUN_MODE": "RUN_MODE",
-            "DETECTOR_SERVICE_INTERVAL": "SERVICE_INTERVAL",
-            # Data storage
-            "CHANGE_DETECTOR_DATA_FOLDER": "DATA_FOLDER",
-            "DETECTOR_PREVIOUS_MATCHES_FILE": "PREVIOUS_MATCHES_FILE",
-            "DETECTOR_TEMP_DIRECTORY": "TEMP_FILE_DIRECTORY",
-            # Service URLs (these should remain the same but validate)
-            "FOGIS_API_CLIENT_URL": "FOGIS_API_CLIENT_URL",
-            "WHATSAPP_AVATAR_SERVICE_URL": "WHATSAPP_AVATAR_SERVICE_URL",
-            "GOOGLE_DRIVE_SERVICE_URL": "GOOGLE_DRIVE_SERVICE_URL",
-            "PHONEBOOK_SYNC_SERVICE_URL": "PHONEBOOK_SYNC_SERVICE_URL",
-            # Processing settings
-            "MIN_REFEREES_FOR_WHATSAPP": "MIN_REFEREES_FOR_WHATSAPP",
-            "GDRIVE_FOLDER_BASE": "GDRIVE_FOLDER_BASE",
-            # Logging
-            "LOG_LEVEL": "LOG_LEVEL",
-            "LOG_FORMAT": "LOG_FORMAT",
-            # Health check
-            "HEALTH_SERVER_PORT": "HEALTH_SERVER_PORT",
-            "HEALTH_SERVER_HOST": "HEALTH_SERVER_HOST",
-        }
-
-        # Default values for new unified processor
-        self.default_values = {
-            "PROCESSOR_MODE": "unified",
-            "RUN_MODE": "service",
-            "SERVICE_INTERVAL": "3600",
-            "ENABLE_CHANGE_CATEGORIZATION": "true",
-            "CHANGE_PRIORITY_SAME_DAY": "critical",
-            "ENABLE_SEMANTIC_ANALYSIS": "true",
-            "FALLBACK_TO_LEGACY": "true",
-            "ENABLE_DELIVERY_MONITORING": "true",
-            "TZ": "Europe/Stockholm",
-        }
+        self.env_mapping = ENV_MAPPING
+        self.default_values = DEFAULT_VALUES
+        self.deprecated_values = DEPRECATED_VALUES
 
-        # Values to remove (no longer needed)
-        self.deprecated_values = {
-            "WEBHOOK_URL",
-            "WEBHOOK_SECRET",
-            "WEBHOOK_ENABLED",
-            "CHANGE_DETECTOR_WEBHOOK_PORT",
-            "DETECTOR_WEBHOOK_HOST",
-        }
+        # Hashable snapshot of the rules, built once and passed to the cached migration plan
+        self._plan_rules = (
+            tuple(self.env_mapping.items()),
+            tuple(self.default_values),
+            frozenset(self.deprecated_values),
+        )
 
     def load_env_file(self, env_file_path: str) -> Dict[str, str]:
         """Load environment variables from .env file."""
@@ -93,6 +140,12 @@ class ConfigurationMigrator:
                     if "=" in line:
                         key, value = line.split("=", 1)
                         key = key.strip()
+                        if not _ENV_NAME_RE.match(key):
+                            logger.warning(
+                                f"Invalid variable name on line {line_num} "
+                                f"in {env_file_path}: {key}"
+                            )
+                            continue
                         value = value.strip().strip('"').strip("'")
                         env_vars[key] = value
                     else:
@@ -107,42 +160,39 @@ class ConfigurationMigrator:
 
     def migrate_environment_variables(self, old_env: Dict[str, str]) -> Dict[str, str]:
         """Convert old environment variables to new format."""
+        mapped, preserved, defaulted, deprecated = _plan_migration(
+            tuple(old_env), *self._plan_rules
+        )
         new_env = {}
-        migration_log = []
+        migration_log = io.StringIO()
 
         # Apply mappings
-        for old_key, new_key in self.env_mapping.items():
-            if old_key in old_env:
-                new_env[new_key] = old_env[old_key]
-                migration_log.append(f"Mapped {old_key} -> {new_key}: {old_env[old_key]}")
+        for old_key, new_key in mapped:
+            new_env[new_key] = old_env[old_key]
+            migration_log.write(f"Mapped {old_key} -> {new_key}: {old_env[old_key]}\n")
 
         # Copy unchanged variables
-        for key, value in old_env.items():
-            if key not in self.env_mapping and key not in self.deprecated_values:
-                new_env[key] = value
-                migration_log.append(f"Preserved {key}: {value}")
+        for key in preserved:
+            new_env[key] = old_env[key]
+            migration_log.write(f"Preserved {key}: {old_env[key]}\n")
 
         # Add default values for new features (these override any existing values)
-        for key, value in self.default_values.items():
-            if key not in new_env or key == "PROCESSOR_MODE":  # Always override PROCESSOR_MODE
-                new_env[key] = value
-                migration_log.append(f"Added default {key}: {value}")
+        for key in defaulted:
+            new_env[key] = self.default_values[key]
+            migration_log.write(f"Added default {key}: {self.default_values[key]}\n")
 
         # Log deprecated values
-        for key in self.deprecated_values:
-            if key in old_env:
-                migration_log.append(f"Deprecated {key}: {old_env[key]} (removed)")
+        for key in deprecated:
+            migration_log.write(f"Deprecated {key}: {old_env[key]} (removed)\n")
 
         # Save migration log
-        self._save_migration_log(migration_log)
+        self._save_migration_log(migration_log.getvalue())
 
         logger.info(f"Migrated {len(old_env)} -> {len(new_env)} environment variables")
         return new_env
 
-    def validate_configuration(self, config: Dict[str, str]) -> List[str]:
-        """Validate migrated configuration for completeness."""
-        warnings = []
-
+    def validate_configuration(self, config: Dict[str, str]) -> Iterator[str]:
+        """Validate migrated configuration for completeness, yielding each warning."""
         # Required variables
         required_vars = [
             "PROCESSOR_MODE",
@@ -153,14 +203,14 @@ class ConfigurationMigrator:
 
         for var in required_vars:
             if var not in config:
-                warnings.append(f"Missing required variable: {var}")
+                yield f"Missing required variable: {var}"
 
         # Validate specific values
         if config.get("PROCESSOR_MODE") != "unified":
-            warnings.append("PROCESSOR_MODE should be 'unified' for the new service")
+            yield "PROCESSOR_MODE should be 'unified' for the new service"
 
         if config.get("RUN_MODE") not in ["service", "oneshot"]:
-            warnings.append("RUN_MODE should be 'service' or 'oneshot'")
+            yield "RUN_MODE should be 'service' or 'oneshot'"
 
         # Validate URLs
         url_vars = [
@@ -172,7 +222,7 @@ class ConfigurationMigrator:
 
         for var in url_vars:
             if var in config and not config[var].startswith(("http://", "https://")):
-                warnings.append(f"{var} should be a valid URL")
+                yield f"{var} should be a valid URL"
 
         # Validate numeric values
         numeric_vars = {
@@ -182,14 +232,15 @@ class ConfigurationMigrator:
 
         for var, (min_val, max_val) in numeric_vars.items():
             if var in config:
-                try:
-                    value = int(config[var])
-                    if not (min_val <= value <= max_val):
-                        warnings.append(f"{var} should be between {min_val} and {max_val}")
-                except ValueError:
-                    warnings.append(f"{var} should be a numeric value")
+                raw_value = config[var]
+                digits = raw_value[1:] if raw_value.startswith("-") else raw_value
+                if not digits.isdecimal():
+                    yield f"{var} should be a numeric value"
+                    continue
 
-        return warnings
+                value = int(raw_value)
+                if not (min_val <= value <= max_val):
+                    yield f"{var} should be between {min_val} and {max_val}"
 
     def save_env_file(self, env_vars: Dict[str, str], output_path: str) -> None:
         """Save environment variables to .env file."""
@@ -255,7 +306,7 @@ class ConfigurationMigrator:
 
         logger.info(f"Saved migrated configuration to {output_path}")
 
-    def _save_migration_log(self, migration_log: List[str]) -> None:
+    def _save_migration_log(self, migration_log: str) -> None:
         """Save migration log for audit purposes."""
         log_file = self.backup_dir / f"migration_log_{self.migration_timestamp}.txt"
 
@@ -265,9 +316,7 @@ class ConfigurationMigrator:
                 f.write(f"Timestamp: {datetime.now().isoformat()}\n")
                 f.write("Tool Version: 1.0\n")
                 f.write("=" * 50 + "\n\n")
-
-                for entry in migration_log:
-                    f.write(f"{entry}\n")
+                f.write(migration_log)
 
         except Exception as e:
             logger.warning(f"Could not save migration log: {e}")
@@ -285,9 +334,10 @@ class ConfigurationMigrator:
 
             # Validate migrated configuration
             warnings = self.validate_configuration(new_env)
-            if warnings:
+            first_warning = next(warnings, None)
+            if first_warning is not None:
                 logger.warning("Configuration validation warnings:")
-                for warning in warnings:
+                for warning in chain((first_warning,), warnings):
                     logger.warning(f"  - {warning}")
 
             # Save migrated configuration
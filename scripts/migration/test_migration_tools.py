@@ -16,20 +16,22 @@ sys.path.append(os.path.dirname(__file__))
 from migrate_config import ConfigurationMigrator  # noqa: E402
 from validate_migrated_config import MigratedConfigValidator  # noqa: E402
 
+# Keep test file I/O in memory where tmpfs is available; an explicit TMPDIR still wins
+TEST_TMP_ROOT = os.environ.get("TMPDIR") or ("/dev/shm" if os.path.isdir("/dev/shm") else None)
+
 
 class TestConfigurationMigrator(unittest.TestCase):
     """Test the configuration migration utility."""
 
     def setUp(self):
         """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
+        self.tmp_ctx = tempfile.TemporaryDirectory(dir=TEST_TMP_ROOT)
+        self.temp_dir = self.tmp_ctx.name
         self.migrator = ConfigurationMigrator(self.temp_dir)
 
     def tearDown(self):
         """Clean up test environment."""
-        import shutil
-
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.tmp_ctx.cleanup()
 
     def test_load_env_file(self):
         """Test loading environment file."""
@@ -53,6 +55,16 @@ LOG_LEVEL=INFO
         self.assertEqual(env_vars["FOGIS_API_CLIENT_URL"], "http://localhost:8080")
         self.assertEqual(env_vars["LOG_LEVEL"], "INFO")
 
+    def test_load_env_file_skips_invalid_names(self):
+        """Test that invalid variable names are skipped."""
+        env_file = os.path.join(self.temp_dir, "invalid.env")
+        with open(env_file, "w") as f:
+            f.write("1FOO=bar\nFOO-BAR=baz\n_VALID_NAME=ok\n")
+
+        env_vars = self.migrator.load_env_file(env_file)
+
+        self.assertEqual(env_vars, {"_VALID_NAME": "ok"})
+
     def test_migrate_environment_variables(self):
         """Test environment variable migration."""
         old_env = {
@@ -92,7 +104,7 @@ LOG_LEVEL=INFO
             "FOGIS_API_CLIENT_URL": "http://localhost:8080",
         }
 
-        warnings = self.migrator.validate_configuration(valid_config)
+        warnings = list(self.migrator.validate_configuration(valid_config))
         self.assertEqual(len(warnings), 0)
 
         # Invalid configuration
@@ -102,7 +114,7 @@ LOG_LEVEL=INFO
             "FOGIS_API_CLIENT_URL": "not-a-url",
         }
 
-        warnings = self.migrator.validate_configuration(invalid_config)
+        warnings = list(self.migrator.validate_configuration(invalid_config))
         self.assertGreater(len(warnings), 0)
 
     def test_save_env_file(self):
@@ -133,14 +145,13 @@ class TestMigratedConfigValidator(unittest.TestCase):
 
     def setUp(self):
         """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
+        self.tmp_ctx = tempfile.TemporaryDirectory(dir=TEST_TMP_ROOT)
+        self.temp_dir = self.tmp_ctx.name
         self.validator = MigratedConfigValidator()
 
     def tearDown(self):
         """Clean up test environment."""
-        import shutil
-
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.tmp_ctx.cleanup()
 
     def test_validate_required_variables(self):
         """Test required variable validation."""
@@ -215,19 +226,33 @@ LOG_LEVEL=INFO
         self.assertTrue(success)
         self.assertEqual(len(errors), 0)
 
+    def test_fail_fast_validation(self):
+        """Test that fail-fast mode stops after the first failing validator."""
+        config_file = os.path.join(self.temp_dir, "broken.env")
+        with open(config_file, "w") as f:
+            f.write("RUN_MODE=invalid\nENABLE_SEMANTIC_ANALYSIS=maybe\n")
+
+        success, errors, _ = MigratedConfigValidator().validate_configuration(config_file)
+        self.assertFalse(success)
+        self.assertTrue(any("ENABLE_SEMANTIC_ANALYSIS" in e for e in errors))
+
+        validator = MigratedConfigValidator(fail_fast=True)
+        success, errors, _ = validator.validate_configuration(config_file)
+        self.assertFalse(success)
+        self.assertFalse(any("ENABLE_SEMANTIC_ANALYSIS" in e for e in errors))
+
 
 class TestMigrationIntegration(unittest.TestCase):
     """Test integration between migration components."""
 
     def setUp(self):
         """Set up test environment."""
-        self.temp_dir = tempfile.mkdtemp()
+        self.tmp_ctx = tempfile.TemporaryDirectory(dir=TEST_TMP_ROOT)
+        self.temp_dir = self.tmp_ctx.name
 
     def tearDown(self):
         """Clean up test environment."""
-        import shutil
-
-        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        self.tmp_ctx.cleanup()
 
     def test_end_to_end_migration(self):
         """Test complete migration process."""
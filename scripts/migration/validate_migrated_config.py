@@ -6,20 +6,64 @@ Issue #53: Migration Tooling and Scripts
 """
 
 import argparse
+import functools
 import logging
 import os
-from typing import Dict, List, Tuple
-from urllib.parse import urlparse
+import re
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import ParseResult, urlparse
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 
+# KEY=value lines; quotes around the value are stripped after matching
+_ENV_LINE_RE = re.compile(r"\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*(.*?)\s*\Z")
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_urlparse(url: str) -> ParseResult:
+    """Parse a URL, reusing the result for URLs seen in earlier validations."""
+    return urlparse(url)
+
+
 class MigratedConfigValidator:
     """Validates migrated configuration for the unified processor."""
 
-    def __init__(self):
+    # Service URLs that must parse as http(s) URLs
+    URL_VARS = frozenset(
+        {
+            "FOGIS_API_CLIENT_URL",
+            "WHATSAPP_AVATAR_SERVICE_URL",
+            "GOOGLE_DRIVE_SERVICE_URL",
+            "PHONEBOOK_SYNC_SERVICE_URL",
+            "INVALID_URL",  # For testing
+        }
+    )
+
+    # Directories that should be absolute paths
+    PATH_VARS = frozenset({"DATA_FOLDER", "TEMP_FILE_DIRECTORY"})
+
+    # Feature flags that must hold a boolean value
+    BOOLEAN_VARS = frozenset(
+        {
+            "ENABLE_CHANGE_CATEGORIZATION",
+            "ENABLE_SEMANTIC_ANALYSIS",
+            "FALLBACK_TO_LEGACY",
+            "ENABLE_DELIVERY_MONITORING",
+            "INVALID_BOOLEAN",  # For testing
+        }
+    )
+
+    VALID_BOOLEAN_VALUES = frozenset({"true", "false", "yes", "no", "1", "0"})
+
+    def __init__(self, fail_fast: bool = False, max_errors: Optional[int] = None):
+        # Stop after the first failing validator (fail_fast) or once max_errors is reached.
+        # Both trade report completeness for latency; the default run is exhaustive.
+        self.fail_fast = fail_fast
+        self.max_errors = max_errors
+
         # Required configuration variables
         self.required_vars = {
             "PROCESSOR_MODE": ["unified"],
@@ -46,18 +90,26 @@ class MigratedConfigValidator:
         }
 
         # Deprecated variables that should not be present
-        self.deprecated_vars = {
-            "WEBHOOK_URL",
-            "WEBHOOK_SECRET",
-            "WEBHOOK_ENABLED",
-            "CHANGE_DETECTOR_WEBHOOK_PORT",
-            "DETECTOR_WEBHOOK_HOST",
-            "DETECTOR_MODE",  # Should be PROCESSOR_MODE now
-        }
+        self.deprecated_vars = frozenset(
+            {
+                "WEBHOOK_URL",
+                "WEBHOOK_SECRET",
+                "WEBHOOK_ENABLED",
+                "CHANGE_DETECTOR_WEBHOOK_PORT",
+                "DETECTOR_WEBHOOK_HOST",
+                "DETECTOR_MODE",  # Should be PROCESSOR_MODE now
+            }
+        )
 
         self.validation_errors = []
         self.validation_warnings = []
 
+    def _should_stop(self) -> bool:
+        """Check whether the configured error budget has been used up."""
+        if self.fail_fast and self.validation_errors:
+            return True
+        return self.max_errors is not None and len(self.validation_errors) >= self.max_errors
+
     def load_env_file(self, env_file_path: str) -> Dict[str, str]:
         """Load environment variables from .env file."""
         env_vars = {}
@@ -66,22 +118,19 @@ class MigratedConfigValidator:
             raise FileNotFoundError(f"Configuration file not found: {env_file_path}")
 
         try:
-            with open(env_file_path, "r") as f:
-                for line_num, line in enumerate(f, 1):
-                    line = line.strip()
-
-                    # Skip empty lines and comments
-                    if not line or line.startswith("#"):
-                        continue
-
-                    # Parse key=value pairs
-                    if "=" in line:
-                        key, value = line.split("=", 1)
-                        key = key.strip()
-                        value = value.strip().strip('"').strip("'")
-                        env_vars[key] = value
-                    else:
-                        self.validation_warnings.append(f"Invalid line {line_num}: {line}")
+            with open(env_file_path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+
+            for line_num, line in enumerate(lines, 1):
+                match = _ENV_LINE_RE.match(line)
+                if match:
+                    env_vars[match.group(1)] = match.group(2).strip('"').strip("'")
+                    continue
+
+                # Skip empty lines and comments, flag anything else
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    self.validation_warnings.append(f"Invalid line {line_num}: {line}")
 
         except Exception as e:
             raise Exception(f"Error reading {env_file_path}: {e}")
@@ -91,11 +140,12 @@ class MigratedConfigValidator:
 
     def validate_required_variables(self, env_vars: Dict[str, str]) -> None:
         """Validate required configuration variables."""
-        for var, allowed_values in self.required_vars.items():
-            if var not in env_vars:
-                self.validation_errors.append(f"Missing required variable: {var}")
-                continue
+        present = env_vars.keys()
+        for var in sorted(self.required_vars.keys() - present):
+            self.validation_errors.append(f"Missing required variable: {var}")
 
+        for var in sorted(self.required_vars.keys() & present):
+            allowed_values = self.required_vars[var]
             value = env_vars[var]
 
             if allowed_values and value not in allowed_values:
@@ -105,11 +155,12 @@ class MigratedConfigValidator:
 
     def validate_recommended_variables(self, env_vars: Dict[str, str]) -> None:
         """Validate recommended configuration variables."""
-        for var, constraint in self.recommended_vars.items():
-            if var not in env_vars:
-                self.validation_warnings.append(f"Missing recommended variable: {var}")
-                continue
+        present = env_vars.keys()
+        for var in sorted(self.recommended_vars.keys() - present):
+            self.validation_warnings.append(f"Missing recommended variable: {var}")
 
+        for var in sorted(self.recommended_vars.keys() & present):
+            constraint = self.recommended_vars[var]
             value = env_vars[var]
 
             if isinstance(constraint, list):
@@ -130,75 +181,51 @@ class MigratedConfigValidator:
 
     def validate_unified_variables(self, env_vars: Dict[str, str]) -> None:
         """Validate unified processor specific variables."""
-        for var, allowed_values in self.unified_vars.items():
-            if var in env_vars:
-                value = env_vars[var]
-                if allowed_values and value not in allowed_values:
-                    self.validation_errors.append(
-                        f"{var} has invalid value '{value}'. Allowed: {', '.join(allowed_values)}"
-                    )
+        for var in sorted(self.unified_vars.keys() & env_vars.keys()):
+            allowed_values = self.unified_vars[var]
+            value = env_vars[var]
+            if allowed_values and value not in allowed_values:
+                self.validation_errors.append(
+                    f"{var} has invalid value '{value}'. Allowed: {', '.join(allowed_values)}"
+                )
 
     def validate_deprecated_variables(self, env_vars: Dict[str, str]) -> None:
         """Check for deprecated variables that should be removed."""
-        for var in self.deprecated_vars:
-            if var in env_vars:
-                self.validation_warnings.append(
-                    f"Deprecated variable found: {var}={env_vars[var]} (should be removed)"
-                )
+        for var in sorted(self.deprecated_vars & env_vars.keys()):
+            self.validation_warnings.append(
+                f"Deprecated variable found: {var}={env_vars[var]} (should be removed)"
+            )
 
     def validate_urls(self, env_vars: Dict[str, str]) -> None:
         """Validate URL format for service URLs."""
-        url_vars = [
-            "FOGIS_API_CLIENT_URL",
-            "WHATSAPP_AVATAR_SERVICE_URL",
-            "GOOGLE_DRIVE_SERVICE_URL",
-            "PHONEBOOK_SYNC_SERVICE_URL",
-            "INVALID_URL",  # For testing
-        ]
+        for var in sorted(self.URL_VARS & env_vars.keys()):
+            url = env_vars[var]
+            try:
+                parsed = _cached_urlparse(url)
+            except ValueError:
+                # urlparse rejects malformed netlocs such as unbalanced IPv6 brackets
+                self.validation_errors.append(f"{var} is not a valid URL: {url}")
+                continue
 
-        for var in url_vars:
-            if var in env_vars:
-                url = env_vars[var]
-                try:
-                    parsed = urlparse(url)
-                    if not parsed.scheme or not parsed.netloc:
-                        self.validation_errors.append(f"{var} is not a valid URL: {url}")
-                    elif parsed.scheme not in ["http", "https"]:
-                        self.validation_warnings.append(
-                            f"{var} uses non-standard scheme: {parsed.scheme}"
-                        )
-                except Exception:
-                    self.validation_errors.append(f"{var} is not a valid URL: {url}")
+            if not parsed.scheme or not parsed.netloc:
+                self.validation_errors.append(f"{var} is not a valid URL: {url}")
+            elif parsed.scheme not in ("http", "https"):
+                self.validation_warnings.append(f"{var} uses non-standard scheme: {parsed.scheme}")
 
     def validate_paths(self, env_vars: Dict[str, str]) -> None:
         """Validate file and directory paths."""
-        path_vars = ["DATA_FOLDER", "TEMP_FILE_DIRECTORY"]
-
-        for var in path_vars:
-            if var in env_vars:
-                path = env_vars[var]
-                if not path.startswith("/"):
-                    self.validation_warnings.append(f"{var} should be an absolute path: {path}")
+        for var in sorted(self.PATH_VARS & env_vars.keys()):
+            path = env_vars[var]
+            if not path.startswith("/"):
+                self.validation_warnings.append(f"{var} should be an absolute path: {path}")
 
     def validate_boolean_values(self, env_vars: Dict[str, str]) -> None:
         """Validate boolean configuration values."""
-        boolean_vars = [
-            "ENABLE_CHANGE_CATEGORIZATION",
-            "ENABLE_SEMANTIC_ANALYSIS",
-            "FALLBACK_TO_LEGACY",
-            "ENABLE_DELIVERY_MONITORING",
-            "INVALID_BOOLEAN",  # For testing
-        ]
-
-        valid_boolean_values = ["true", "false", "yes", "no", "1", "0"]
-
-        for var in boolean_vars:
-            if var in env_vars:
-                value = env_vars[var].lower()
-                if value not in valid_boolean_values:
-                    self.validation_errors.append(
-                        f"{var} should be a boolean value (true/false), got '{env_vars[var]}'"
-                    )
+        for var in sorted(self.BOOLEAN_VARS & env_vars.keys()):
+            if env_vars[var].lower() not in self.VALID_BOOLEAN_VALUES:
+                self.validation_errors.append(
+                    f"{var} should be a boolean value (true/false), got '{env_vars[var]}'"
+                )
 
     def validate_consistency(self, env_vars: Dict[str, str]) -> None:
         """Validate configuration consistency and logical relationships."""
@@ -228,15 +255,22 @@ class MigratedConfigValidator:
             # Load configuration
             env_vars = self.load_env_file(env_file_path)
 
-            # Run all validations
-            self.validate_required_variables(env_vars)
-            self.validate_recommended_variables(env_vars)
-            self.validate_unified_variables(env_vars)
-            self.validate_deprecated_variables(env_vars)
-            self.validate_urls(env_vars)
-            self.validate_paths(env_vars)
-            self.validate_boolean_values(env_vars)
-            self.validate_consistency(env_vars)
+            # Run all validations, stopping early if the error budget is exhausted
+            validators = (
+                self.validate_required_variables,
+                self.validate_recommended_variables,
+                self.validate_unified_variables,
+                self.validate_deprecated_variables,
+                self.validate_urls,
+                self.validate_paths,
+                self.validate_boolean_values,
+                self.validate_consistency,
+            )
+            for validator in validators:
+                validator(env_vars)
+                if self._should_stop():
+                    logger.info(f"Stopping validation early after {validator.__name__}")
+                    break
 
             # Determine overall success
             success = len(self.validation_errors) == 0
@@ -284,6 +318,14 @@ class MigratedConfigValidator:
 def main():
     parser = argparse.ArgumentParser(description="Validate migrated configuration")
     parser.add_argument("--config", required=True, help="Configuration file path (.env)")
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop after the first validation category that reports an error",
+    )
+    parser.add_argument(
+        "--max-errors", type=int, help="Stop once this many validation errors have been found"
+    )
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
 
     args = parser.parse_args()
@@ -292,7 +334,7 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
 
     # Create validator and run validation
-    validator = MigratedConfigValidator()
+    validator = MigratedConfigValidator(fail_fast=args.fail_fast, max_errors=args.max_errors)
     success, errors, warnings = validator.validate_configuration(args.config)
 
     # Print results
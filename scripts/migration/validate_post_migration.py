@@ -9,16 +9,36 @@ import argparse
 import json
 import logging
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from validate_migrated_config import MigratedConfigValidator
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import docker
+
+    HAS_DOCKER_SDK = True
+except ImportError:
+    HAS_DOCKER_SDK = False
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
+# Prefer orjson's C parser for health payloads; json.loads also accepts bytes
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
 
 class PostMigrationValidator:
     """Validates successful migration to unified processor."""
@@ -27,14 +47,43 @@ class PostMigrationValidator:
         self.backup_dir = Path(backup_dir)
         self.validation_results = []
         self.service_url = "http://localhost:8000"
+        # /health/detailed body shared by the detailed, semantic and network checks
+        self._detailed_cache: Optional[Dict[str, Any]] = None
+        self._group_results: Dict[str, Dict[str, Any]] = {}
+
+        # Keep-alive session shared by every health check; sized for the concurrent groups
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Talk to the Docker socket directly when docker-py is installed; otherwise shell out
+        self._docker = None
+        if HAS_DOCKER_SDK:
+            try:
+                self._docker = docker.from_env()
+            except docker.errors.DockerException as e:
+                logger.debug(f"Docker SDK unavailable, falling back to docker CLI: {e}")
+
+    def close(self) -> None:
+        """Release pooled HTTP connections and the Docker client."""
+        self.session.close()
+        if self._docker is not None:
+            self._docker.close()
+
+    def __enter__(self) -> "PostMigrationValidator":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     def validate_service_health(self) -> Tuple[bool, str]:
         """Validate service health and responsiveness."""
         try:
             # Test simple health endpoint
-            response = requests.get(f"{self.service_url}/health/simple", timeout=10)
+            response = self.session.get(f"{self.service_url}/health/simple", timeout=10)
             if response.status_code == 200:
-                health_data = response.json()
+                health_data = _json_loads(response.content)
                 if health_data.get("status") == "healthy":
                     return True, "Service health check passed"
                 else:
@@ -42,15 +91,16 @@ class PostMigrationValidator:
             else:
                 return False, f"Health check failed with status {response.status_code}"
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
             return False, f"Health check request failed: {e}"
 
     def validate_detailed_health(self) -> Tuple[bool, str]:
         """Validate detailed health endpoint with dependency checks."""
         try:
-            response = requests.get(f"{self.service_url}/health/detailed", timeout=15)
+            response = self.session.get(f"{self.service_url}/health/detailed", timeout=15)
             if response.status_code == 200:
-                health_data = response.json()
+                health_data = _json_loads(response.content)
+                self._detailed_cache = health_data
 
                 # Check overall status
                 if health_data.get("status") != "healthy":
@@ -68,41 +118,57 @@ class PostMigrationValidator:
 
                 return True, "Detailed health check passed"
             else:
+                self._detailed_cache = None
                 return False, f"Detailed health check failed with status {response.status_code}"
 
-        except requests.exceptions.RequestException as e:
+        except (requests.exceptions.RequestException, ValueError) as e:
+            self._detailed_cache = None
             return False, f"Detailed health check request failed: {e}"
 
     def validate_semantic_analysis_integration(self) -> Tuple[bool, str]:
         """Validate semantic analysis integration is working."""
-        try:
-            # Check if semantic analysis endpoint is available
-            # This would be a test endpoint that verifies semantic analysis is working
-            response = requests.get(f"{self.service_url}/health/detailed", timeout=10)
-            if response.status_code == 200:
-                health_data = response.json()
-
-                # Check if semantic analysis is mentioned in the health data
-                features = health_data.get("features", {})
-                if "semantic_analysis" in features:
-                    if features["semantic_analysis"]:
-                        return True, "Semantic analysis integration verified"
-                    else:
-                        return False, "Semantic analysis is disabled"
-                else:
-                    # If not explicitly mentioned, assume it's working if service is healthy
-                    return True, "Semantic analysis integration assumed working (service healthy)"
-            else:
-                return (
-                    False,
-                    f"Could not verify semantic analysis integration (status {response.status_code})",
-                )
+        health_data = self._detailed_cache
+        if health_data is None:
+            try:
+                # Check if semantic analysis endpoint is available
+                # This would be a test endpoint that verifies semantic analysis is working
+                response = self.session.get(f"{self.service_url}/health/detailed", timeout=10)
+                if response.status_code != 200:
+                    return (
+                        False,
+                        f"Could not verify semantic analysis integration "
+                        f"(status {response.status_code})",
+                    )
+                health_data = _json_loads(response.content)
 
-        except requests.exceptions.RequestException as e:
-            return False, f"Semantic analysis integration check failed: {e}"
+            except (requests.exceptions.RequestException, ValueError) as e:
+                return False, f"Semantic analysis integration check failed: {e}"
+
+        # Check if semantic analysis is mentioned in the health data
+        features = health_data.get("features", {})
+        if "semantic_analysis" in features:
+            if features["semantic_analysis"]:
+                return True, "Semantic analysis integration verified"
+            else:
+                return False, "Semantic analysis is disabled"
+        else:
+            # If not explicitly mentioned, assume it's working if service is healthy
+            return True, "Semantic analysis integration assumed working (service healthy)"
 
     def validate_docker_services(self) -> Tuple[bool, str]:
         """Validate Docker services are running correctly."""
+        if self._docker is not None:
+            try:
+                container = self._docker.containers.get("process-matches-service")
+            except docker.errors.NotFound:
+                return False, "process-matches-service not found in running containers"
+            except docker.errors.DockerException as e:
+                return False, f"Docker service validation failed: {e}"
+
+            if container.status == "running":
+                return True, "Docker service is running"
+            return False, f"Docker service is not in 'Up' state (status: {container.status})"
+
         try:
             # Check if the new service is running
             result = subprocess.run(
@@ -134,21 +200,26 @@ class PostMigrationValidator:
         """Validate data integrity after migration."""
         try:
             # Check if data volume exists and is accessible
-            result = subprocess.run(
-                ["docker", "volume", "ls"], capture_output=True, text=True, timeout=10
-            )
+            if self._docker is not None:
+                try:
+                    self._docker.volumes.get("process-matches-data")
+                except docker.errors.NotFound:
+                    return False, "process-matches-data volume not found"
+            else:
+                result = subprocess.run(
+                    ["docker", "volume", "ls"], capture_output=True, text=True, timeout=10
+                )
 
-            if result.returncode != 0:
-                return False, f"Docker volume ls command failed: {result.stderr}"
+                if result.returncode != 0:
+                    return False, f"Docker volume ls command failed: {result.stderr}"
 
-            if "process-matches-data" not in result.stdout:
-                return False, "process-matches-data volume not found"
+                if "process-matches-data" not in result.stdout:
+                    return False, "process-matches-data volume not found"
 
             # Check if previous matches file exists (if it should)
             backup_metadata_file = self.backup_dir / "migration_metadata.json"
             if backup_metadata_file.exists():
-                with open(backup_metadata_file, "r") as f:
-                    metadata = json.load(f)
+                metadata = _json_loads(backup_metadata_file.read_bytes())
 
                 if metadata.get("backup_contents", {}).get("data_volume", False):
                     # Data was backed up, so it should be restored
@@ -169,14 +240,8 @@ class PostMigrationValidator:
             if not env_file.exists():
                 return False, ".env file not found after migration"
 
-            # Read and validate key configuration values
-            env_vars = {}
-            with open(env_file, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, value = line.split("=", 1)
-                        env_vars[key.strip()] = value.strip()
+            # Read key configuration values with the same parser the config validator uses
+            env_vars = MigratedConfigValidator().load_env_file(str(env_file))
 
             # Check required variables
             required_vars = ["PROCESSOR_MODE", "RUN_MODE", "DATA_FOLDER", "FOGIS_API_CLIENT_URL"]
@@ -199,9 +264,13 @@ class PostMigrationValidator:
 
     def validate_network_connectivity(self) -> Tuple[bool, str]:
         """Validate network connectivity to dependent services."""
+        if self._detailed_cache is not None:
+            # A successful /health/detailed round trip already proves connectivity
+            return True, "Network connectivity validation passed"
+
         try:
             # Test connectivity to the main service
-            response = requests.get(f"{self.service_url}/health/simple", timeout=5)
+            response = self.session.get(f"{self.service_url}/health/simple", timeout=5)
             if response.status_code != 200:
                 return False, f"Network connectivity test failed (status {response.status_code})"
 
@@ -210,50 +279,79 @@ class PostMigrationValidator:
         except requests.exceptions.RequestException as e:
             return False, f"Network connectivity test failed: {e}"
 
+    def _run_validation(self, name: str, validation_func: Callable[[], Tuple[bool, str]]) -> bool:
+        """Run a single validation, record its outcome and return whether it passed."""
+        logger.info(f"Running {name} validation...")
+
+        try:
+            success, message = validation_func()
+        except Exception as e:
+            success, message = False, f"Validation error: {e}"
+
+        self._group_results[name] = {"success": success, "message": message}
+        if success:
+            logger.info(f"✅ {name}: {message}")
+        else:
+            logger.error(f"❌ {name}: {message}")
+        return success
+
+    def _run_validation_group(
+        self, group: List[Tuple[str, Callable[[], Tuple[bool, str]]]]
+    ) -> None:
+        """Run a group of validations in order on the calling thread."""
+        for name, validation_func in group:
+            self._run_validation(name, validation_func)
+
     def run_all_validations(self) -> Dict[str, Any]:
         """Run all post-migration validations."""
-        validations = [
-            ("Service Health", self.validate_service_health),
-            ("Detailed Health", self.validate_detailed_health),
-            ("Docker Services", self.validate_docker_services),
-            ("Data Integrity", self.validate_data_integrity),
-            ("Configuration Migration", self.validate_configuration_migration),
-            ("Network Connectivity", self.validate_network_connectivity),
-            ("Semantic Analysis Integration", self.validate_semantic_analysis_integration),
+        # Checks within a group run in order; groups run concurrently. The detailed health
+        # check goes first in its group so the checks after it can reuse its cached response.
+        validation_groups = [
+            [("Service Health", self.validate_service_health)],
+            [
+                ("Detailed Health", self.validate_detailed_health),
+                ("Network Connectivity", self.validate_network_connectivity),
+                ("Semantic Analysis Integration", self.validate_semantic_analysis_integration),
+            ],
+            [("Docker Services", self.validate_docker_services)],
+            [("Data Integrity", self.validate_data_integrity)],
+            [("Configuration Migration", self.validate_configuration_migration)],
+        ]
+        report_order = [
+            "Service Health",
+            "Detailed Health",
+            "Docker Services",
+            "Data Integrity",
+            "Configuration Migration",
+            "Network Connectivity",
+            "Semantic Analysis Integration",
         ]
 
         results = {
             "timestamp": datetime.now().isoformat(),
             "validations": {},
             "overall_success": True,
-            "summary": {"total": len(validations), "passed": 0, "failed": 0},
+            "summary": {"total": len(report_order), "passed": 0, "failed": 0},
         }
 
         logger.info("Running post-migration validations...")
 
-        for name, validation_func in validations:
-            logger.info(f"Running {name} validation...")
-
-            try:
-                success, message = validation_func()
-                results["validations"][name] = {"success": success, "message": message}
-
-                if success:
-                    results["summary"]["passed"] += 1
-                    logger.info(f"✅ {name}: {message}")
-                else:
-                    results["summary"]["failed"] += 1
-                    results["overall_success"] = False
-                    logger.error(f"❌ {name}: {message}")
-
-            except Exception as e:
-                results["validations"][name] = {
-                    "success": False,
-                    "message": f"Validation error: {e}",
-                }
+        self._group_results = {}
+        with ThreadPoolExecutor(max_workers=len(validation_groups)) as executor:
+            for future in [
+                executor.submit(self._run_validation_group, g) for g in validation_groups
+            ]:
+                future.result()
+
+        # Report in the declared order regardless of completion order
+        for name in report_order:
+            outcome = self._group_results[name]
+            results["validations"][name] = outcome
+            if outcome["success"]:
+                results["summary"]["passed"] += 1
+            else:
                 results["summary"]["failed"] += 1
                 results["overall_success"] = False
-                logger.error(f"❌ {name}: Validation error: {e}")
 
         return results
 
@@ -265,8 +363,11 @@ class PostMigrationValidator:
         )
 
         try:
-            with open(report_file, "w") as f:
-                json.dump(results, f, indent=2)
+            if HAS_ORJSON:
+                report_file.write_bytes(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+            else:
+                with open(report_file, "w") as f:
+                    json.dump(results, f, indent=2)
 
             logger.info(f"Validation report saved to {report_file}")
 
@@ -288,14 +389,14 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
 
     # Create validator
-    validator = PostMigrationValidator(args.backup_dir)
-    validator.service_url = args.service_url
+    with PostMigrationValidator(args.backup_dir) as validator:
+        validator.service_url = args.service_url
 
-    # Run validations
-    results = validator.run_all_validations()
+        # Run validations
+        results = validator.run_all_validations()
 
-    # Save report
-    validator.save_validation_report(results)
+        # Save report
+        validator.save_validation_report(results)
 
     # Print summary
     print("\n" + "=" * 50)
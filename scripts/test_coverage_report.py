@@ -6,12 +6,75 @@ This script provides detailed analysis of test coverage, identifies gaps,
 and generates comprehensive reports for the unified match processor service.
 """
 
+import contextlib
+import heapq
+import io
 import json
+import os
+import re
+import signal
 import subprocess
 import sys
+import threading
+import xml.etree.ElementTree as ET
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Prefer orjson's C parser for large coverage reports; json.loads also accepts bytes
+_json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+# Shared read-only stand-in for files without a coverage summary
+_EMPTY_SUMMARY: Mapping[str, Any] = MappingProxyType({})
+
+# Overall limit for the coverage test run, on top of pytest-timeout's per-test limit
+TEST_RUN_TIMEOUT = 600  # 10 minutes
+
+# JUnit XML written by the coverage test run, parsed for failing tests instead of stdout
+JUNIT_XML_FILE = ".pytest-junit.xml"
+
+# Directories never descended into when discovering test files
+SKIPPED_DIRS = {"__pycache__", "node_modules", "venv", "env"}
+
+# Category rules in priority order. Each alternative is an anchored lookahead, so the first
+# rule matching anywhere in the path wins (not the leftmost match); lastgroup names it
+CATEGORY_PATTERN = re.compile(
+    r"^(?:"
+    r"(?=.*unit)(?P<unit>)"
+    r"|(?=.*integration)(?P<integration>)"
+    r"|(?=.*performance)(?P<performance>)"
+    r"|(?=.*security)(?P<security>)"
+    r"|(?=.*(?:api|health))(?P<api>)"
+    r"|(?=.*change)(?P<change_detection>)"
+    r"|(?=.*comprehensive)(?P<comprehensive>)"
+    r")"
+)
+
+
+def _iter_test_files(root: str) -> Iterator[str]:
+    """Yield paths of test_*.py files under root, skipping hidden and virtualenv dirs."""
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if not name.startswith(".") and name not in SKIPPED_DIRS:
+                        stack.append(entry.path)
+                elif name.startswith("test_") and name.endswith(".py"):
+                    yield entry.path
 
 
 class CoverageAnalyzer:
@@ -26,35 +89,113 @@ class CoverageAnalyzer:
             "src/core/change_detector.py",
             "src/app_unified.py",
         ]
+        # (mtime_ns, analysis) of the last parsed coverage.json
+        self._coverage_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        # Every gap found by the last identify_coverage_gaps call, in coverage.json order
+        self.all_gaps: List[Dict[str, Any]] = []
 
     def run_comprehensive_tests(self) -> Dict[str, Any]:
         """Run comprehensive test suite and collect coverage data."""
         print("🧪 Running comprehensive test suite...")
 
         # Run tests with coverage
-        cmd = [
-            sys.executable,
-            "-m",
-            "pytest",
+        pytest_args = [
             "tests/",
             "--cov=src",
-            "--cov-report=term-missing",
             "--cov-report=html:htmlcov",
             "--cov-report=xml:coverage.xml",
             "--cov-report=json:coverage.json",
             "--cov-branch",
             "--tb=short",
             "--durations=10",
-            "-v",
+            f"--junit-xml={JUNIT_XML_FILE}",
+            "-q",
         ]
 
+        # Drop a stale report so a run that dies early can't report old failures
+        (self.project_root / JUNIT_XML_FILE).unlink(missing_ok=True)
+
+        # Set TEST_COVERAGE_ISOLATE to run pytest in a fresh interpreter, e.g. when plugin
+        # or import state from this process must not leak into the test session
+        if os.environ.get("TEST_COVERAGE_ISOLATE"):
+            results = self._run_tests_subprocess(pytest_args)
+        else:
+            results = self._run_tests_in_process(pytest_args)
+
+        results["failed_tests"] = self._parse_junit_failures()
+        return results
+
+    def _parse_junit_failures(self) -> List[str]:
+        """Return node IDs of failed or errored tests from the JUnit XML report."""
+        failed = []
+        try:
+            for _, elem in ET.iterparse(self.project_root / JUNIT_XML_FILE):
+                if elem.tag != "testcase":
+                    continue
+                if elem.find("failure") is not None or elem.find("error") is not None:
+                    failed.append(f"{elem.get('classname', '')}::{elem.get('name', '')}")
+                elem.clear()
+        except (OSError, ET.ParseError):
+            return failed
+        return failed
+
+    def _run_tests_in_process(self, pytest_args: List[str]) -> Dict[str, Any]:
+        """Run pytest in this interpreter, capturing its output."""
+        import pytest
+
+        # pytest stays on the main thread (tests install signal handlers); a watchdog sends
+        # SIGINT once the overall limit is reached, which also wakes blocking calls
+        timed_out = threading.Event()
+
+        def interrupt() -> None:
+            timed_out.set()
+            os.kill(os.getpid(), signal.SIGINT)
+
+        watchdog = threading.Timer(TEST_RUN_TIMEOUT, interrupt)
+        watchdog.daemon = True
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        previous_cwd = os.getcwd()
+        os.chdir(self.project_root)
+        try:
+            with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+                watchdog.start()
+                try:
+                    returncode = int(pytest.main(pytest_args))
+                except KeyboardInterrupt:
+                    if not timed_out.is_set():
+                        raise
+                    returncode = -1
+        finally:
+            watchdog.cancel()
+            os.chdir(previous_cwd)
+
+        if timed_out.is_set():
+            return {
+                "success": False,
+                "stdout": stdout.getvalue(),
+                "stderr": f"Test execution timed out after {TEST_RUN_TIMEOUT // 60} minutes",
+                "returncode": -1,
+            }
+
+        return {
+            "success": returncode == 0,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+            "returncode": returncode,
+        }
+
+    def _run_tests_subprocess(self, pytest_args: List[str]) -> Dict[str, Any]:
+        """Run pytest in a separate interpreter."""
+        cmd = [sys.executable, "-m", "pytest", *pytest_args]
+
         try:
             result = subprocess.run(
                 cmd,
                 cwd=self.project_root,
                 capture_output=True,
                 text=True,
-                timeout=600,  # 10 minutes timeout
+                timeout=TEST_RUN_TIMEOUT,
             )
 
             return {
@@ -67,20 +208,31 @@ class CoverageAnalyzer:
             return {
                 "success": False,
                 "stdout": "",
-                "stderr": "Test execution timed out after 10 minutes",
+                "stderr": f"Test execution timed out after {TEST_RUN_TIMEOUT // 60} minutes",
                 "returncode": -1,
             }
 
-    def analyze_coverage_json(self) -> Dict[str, Any]:
-        """Analyze coverage data from JSON report."""
+    def analyze_coverage_json(self, collect_gaps: bool = False) -> Dict[str, Any]:
+        """Analyze coverage data from JSON report.
+
+        With collect_gaps, files below the coverage threshold are also gathered under "gaps"
+        in the same pass, so identify_coverage_gaps only has to rank them.
+        """
         coverage_file = self.project_root / "coverage.json"
 
-        if not coverage_file.exists():
+        try:
+            mtime_ns = coverage_file.stat().st_mtime_ns
+        except FileNotFoundError:
             return {"error": "Coverage JSON file not found"}
 
+        # Reuse the previous analysis unless coverage.json has been regenerated since
+        if self._coverage_cache is not None and self._coverage_cache[0] == mtime_ns:
+            cached = self._coverage_cache[1]
+            if not collect_gaps or "gaps" in cached:
+                return cached
+
         try:
-            with open(coverage_file, "r") as f:
-                coverage_data = json.load(f)
+            coverage_data = _json_loads(coverage_file.read_bytes())
 
             # Extract summary data
             summary = coverage_data.get("totals", {})
@@ -88,16 +240,26 @@ class CoverageAnalyzer:
 
             # Analyze per-file coverage
             file_analysis = {}
+            gaps: List[Dict[str, Any]] = []
+            critical_by_name = self._critical_modules_by_name()
+            threshold = self.coverage_threshold
             for file_path, file_data in files.items():
+                file_summary = file_data.get("summary") or _EMPTY_SUMMARY
+                coverage_percent = file_summary.get("percent_covered", 0)
+                missing_lines = file_data.get("missing_lines", [])
                 file_analysis[file_path] = {
-                    "coverage_percent": file_data.get("summary", {}).get("percent_covered", 0),
-                    "lines_covered": file_data.get("summary", {}).get("covered_lines", 0),
-                    "lines_total": file_data.get("summary", {}).get("num_statements", 0),
-                    "missing_lines": file_data.get("missing_lines", []),
+                    "coverage_percent": coverage_percent,
+                    "lines_covered": file_summary.get("covered_lines", 0),
+                    "lines_total": file_summary.get("num_statements", 0),
+                    "missing_lines": missing_lines,
                     "excluded_lines": file_data.get("excluded_lines", []),
                 }
+                if collect_gaps and coverage_percent < threshold:
+                    gaps.append(
+                        self._make_gap(file_path, coverage_percent, missing_lines, critical_by_name)
+                    )
 
-            return {
+            analysis = {
                 "overall_coverage": summary.get("percent_covered", 0),
                 "lines_covered": summary.get("covered_lines", 0),
                 "lines_total": summary.get("num_statements", 0),
@@ -105,44 +267,78 @@ class CoverageAnalyzer:
                 "branches_total": summary.get("num_branches", 0),
                 "files": file_analysis,
             }
+            if collect_gaps:
+                analysis["gaps"] = gaps
+            self._coverage_cache = (mtime_ns, analysis)
+            return analysis
         except Exception as e:
             return {"error": f"Failed to analyze coverage JSON: {str(e)}"}
 
-    def identify_coverage_gaps(self, coverage_data: Dict[str, Any]) -> List[Dict[str, Any]]:
-        """Identify coverage gaps and prioritize them."""
-        gaps = []
-
-        if "files" not in coverage_data:
-            return gaps
-
-        for file_path, file_data in coverage_data["files"].items():
-            coverage_percent = file_data.get("coverage_percent", 0)
-            missing_lines = file_data.get("missing_lines", [])
-
-            # Identify critical gaps
-            is_critical = any(critical in file_path for critical in self.critical_modules)
-
-            if coverage_percent < self.coverage_threshold:
-                gap = {
-                    "file": file_path,
-                    "coverage_percent": coverage_percent,
-                    "missing_lines": missing_lines,
-                    "lines_missing": len(missing_lines),
-                    "is_critical": is_critical,
-                    "priority": (
-                        "HIGH" if is_critical else "MEDIUM" if coverage_percent < 80 else "LOW"
-                    ),
-                }
-                gaps.append(gap)
+    def _critical_modules_by_name(self) -> Dict[str, str]:
+        """Index critical module paths by file name for constant-time lookups."""
+        return {module.rsplit("/", 1)[-1]: module for module in self.critical_modules}
+
+    @staticmethod
+    def _match_critical_module(file_path: str, critical_by_name: Dict[str, str]) -> Optional[str]:
+        """Return the critical module a coverage file path refers to, if any."""
+        path = file_path.replace("\\", "/")
+        module = critical_by_name.get(path.rsplit("/", 1)[-1])
+        if module is not None and (path == module or path.endswith("/" + module)):
+            return module
+        return None
+
+    def _make_gap(
+        self,
+        file_path: str,
+        coverage_percent: float,
+        missing_lines: List[int],
+        critical_by_name: Dict[str, str],
+    ) -> Dict[str, Any]:
+        """Build the gap entry for a file below the coverage threshold."""
+        is_critical = self._match_critical_module(file_path, critical_by_name) is not None
+        return {
+            "file": file_path,
+            "coverage_percent": coverage_percent,
+            "missing_lines": missing_lines,
+            "lines_missing": len(missing_lines),
+            "is_critical": is_critical,
+            "priority": "HIGH" if is_critical else "MEDIUM" if coverage_percent < 80 else "LOW",
+        }
 
-        # Sort by priority and coverage percentage
-        gaps.sort(key=lambda x: (x["is_critical"], -x["coverage_percent"]), reverse=True)
+    def identify_coverage_gaps(
+        self, coverage_data: Dict[str, Any], limit: int = 10
+    ) -> List[Dict[str, Any]]:
+        """Identify coverage gaps and return the top `limit` by priority."""
+        if "gaps" in coverage_data:
+            # Already collected by analyze_coverage_json(collect_gaps=True)
+            gaps = coverage_data["gaps"]
+        elif "files" in coverage_data:
+            critical_by_name = self._critical_modules_by_name()
+            gaps = [
+                self._make_gap(
+                    file_path,
+                    file_data.get("coverage_percent", 0),
+                    file_data.get("missing_lines", []),
+                    critical_by_name,
+                )
+                for file_path, file_data in coverage_data["files"].items()
+                if file_data.get("coverage_percent", 0) < self.coverage_threshold
+            ]
+        else:
+            gaps = []
+        self.all_gaps = gaps
 
-        return gaps
+        # Critical modules first, then lowest coverage; only the top entries are reported
+        return heapq.nsmallest(
+            limit, gaps, key=lambda x: (not x["is_critical"], x["coverage_percent"])
+        )
 
     def analyze_test_categories(self) -> Dict[str, Any]:
         """Analyze test categories and distribution."""
-        test_files = list(self.project_root.glob("tests/**/*.py"))
+        root = str(self.project_root)
+        test_files = [
+            os.path.relpath(path, root) for path in _iter_test_files(os.path.join(root, "tests"))
+        ]
 
         categories = {
             "unit": [],
@@ -155,25 +351,11 @@ class CoverageAnalyzer:
             "comprehensive": [],
         }
 
-        for test_file in test_files:
-            if test_file.name.startswith("test_"):
-                # Categorize based on file path and name
-                file_path = str(test_file.relative_to(self.project_root))
-
-                if "unit" in file_path:
-                    categories["unit"].append(file_path)
-                elif "integration" in file_path:
-                    categories["integration"].append(file_path)
-                elif "performance" in file_path:
-                    categories["performance"].append(file_path)
-                elif "security" in file_path:
-                    categories["security"].append(file_path)
-                elif "api" in file_path or "health" in file_path:
-                    categories["api"].append(file_path)
-                elif "change" in file_path:
-                    categories["change_detection"].append(file_path)
-                elif "comprehensive" in file_path:
-                    categories["comprehensive"].append(file_path)
+        for file_path in test_files:
+            # Categorize based on file path and name
+            match = CATEGORY_PATTERN.match(file_path)
+            if match:
+                categories[match.lastgroup].append(file_path)
 
         return {
             "categories": categories,
@@ -187,7 +369,7 @@ class CoverageAnalyzer:
 
         # Run tests and collect data
         test_results = self.run_comprehensive_tests()
-        coverage_data = self.analyze_coverage_json()
+        coverage_data = self.analyze_coverage_json(collect_gaps=True)
         coverage_gaps = self.identify_coverage_gaps(coverage_data)
         test_categories = self.analyze_test_categories()
 
@@ -204,6 +386,11 @@ class CoverageAnalyzer:
             report.append("✅ **Test Suite Status:** PASSED")
         else:
             report.append("❌ **Test Suite Status:** FAILED")
+            failed_tests = test_results.get("failed_tests", [])
+            if failed_tests:
+                report.append(f"**Failed Tests ({len(failed_tests)}):**")
+                for test_id in failed_tests[:10]:
+                    report.append(f"   - {test_id}")
             report.append(f"**Error:** {test_results['stderr']}")
         report.append("")
 
@@ -214,13 +401,14 @@ class CoverageAnalyzer:
             overall_coverage = coverage_data.get("overall_coverage", 0)
             status_emoji = "✅" if overall_coverage >= self.coverage_threshold else "⚠️"
 
+            lines_covered = format(coverage_data.get("lines_covered", 0), ",")
+            lines_total = format(coverage_data.get("lines_total", 0), ",")
+            branches_covered = format(coverage_data.get("branches_covered", 0), ",")
+            branches_total = format(coverage_data.get("branches_total", 0), ",")
+
             report.append(f"{status_emoji} **Overall Coverage:** {overall_coverage:.1f}%")
-            report.append(
-                f"📈 **Lines Covered:** {coverage_data.get('lines_covered', 0):,} / {coverage_data.get('lines_total', 0):,}"
-            )
-            report.append(
-                f"🌿 **Branch Coverage:** {coverage_data.get('branches_covered', 0):,} / {coverage_data.get('branches_total', 0):,}"
-            )
+            report.append(f"📈 **Lines Covered:** {lines_covered} / {lines_total}")
+            report.append(f"🌿 **Branch Coverage:** {branches_covered} / {branches_total}")
             report.append(f"🎯 **Target Coverage:** {self.coverage_threshold}%")
         else:
             report.append(f"❌ **Coverage Analysis Failed:** {coverage_data['error']}")
@@ -280,13 +468,16 @@ class CoverageAnalyzer:
             report.append("| Module | Coverage | Status |")
             report.append("|--------|----------|--------|")
 
-            for critical_module in self.critical_modules:
-                module_data = None
-                for file_path, file_data in coverage_data["files"].items():
-                    if critical_module in file_path:
-                        module_data = file_data
-                        break
+            # Index critical modules in one pass over the files; the first matching file wins
+            critical_by_name = self._critical_modules_by_name()
+            critical_data: Dict[str, Dict[str, Any]] = {}
+            for file_path, file_data in coverage_data["files"].items():
+                module = self._match_critical_module(file_path, critical_by_name)
+                if module is not None:
+                    critical_data.setdefault(module, file_data)
 
+            for critical_module in self.critical_modules:
+                module_data = critical_data.get(critical_module)
                 if module_data:
                     coverage = module_data.get("coverage_percent", 0)
                     status = (
@@ -333,9 +524,8 @@ class CoverageAnalyzer:
     def save_report(self, report: str, filename: str = "test_coverage_report.md") -> str:
         """Save coverage report to file."""
         report_path = self.project_root / filename
-
-        with open(report_path, "w") as f:
-            f.write(report)
+        # Explicit UTF-8 so the emoji-heavy report doesn't depend on the platform locale
+        report_path.write_text(report, encoding="utf-8")
 
         return str(report_path)
 
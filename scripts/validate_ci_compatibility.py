@@ -6,16 +6,24 @@ This script validates that code changes will pass CI/CD checks across different
 Run this before committing to catch issues early.
 """
 
+import argparse
+import functools
+import importlib
+import io
 import os
 import subprocess
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Callable, List, Optional, TextIO, Tuple, Union
 
 
-def run_command(cmd: str, description: str) -> bool:
-    """Run a command and return success status."""
-    print(f"\n🔍 {description}")
-    print(f"Running: {cmd}")
+def run_command(cmd: str, description: str, out: Optional[TextIO] = None) -> bool:
+    """Run a command and return success status, reporting progress to out (stdout by default)."""
+    out = out or sys.stdout
+    print(f"\n🔍 {description}", file=out)
+    print(f"Running: {cmd}", file=out)
 
     try:
         result = subprocess.run(
@@ -23,29 +31,82 @@ def run_command(cmd: str, description: str) -> bool:
         )
 
         if result.returncode == 0:
-            print(f"✅ {description} - PASSED")
+            print(f"✅ {description} - PASSED", file=out)
             return True
         else:
-            print(f"❌ {description} - FAILED")
-            print(f"STDOUT:\n{result.stdout}")
-            print(f"STDERR:\n{result.stderr}")
+            print(f"❌ {description} - FAILED", file=out)
+            print(f"STDOUT:\n{result.stdout}", file=out)
+            print(f"STDERR:\n{result.stderr}", file=out)
             return False
 
     except Exception as e:
-        print(f"❌ {description} - ERROR: {e}")
+        print(f"❌ {description} - ERROR: {e}", file=out)
         return False
 
 
+def check_import(module_name: str, description: str, out: Optional[TextIO] = None) -> bool:
+    """Import a module in this interpreter and return whether it succeeded."""
+    out = out or sys.stdout
+    print(f"\n🔍 {description}", file=out)
+    print(f"Running: import {module_name}", file=out)
+
+    try:
+        importlib.import_module(module_name)
+    except Exception as e:
+        print(f"❌ {description} - FAILED", file=out)
+        print(f"{type(e).__name__}: {e}", file=out)
+        return False
+
+    print(f"✅ {description} - PASSED", file=out)
+    return True
+
+
+# A check is a shell command or a callable taking (description, out) that runs in-process
+Check = Tuple[Union[str, Callable[[str, TextIO], bool]], str]
+
+
+def run_check_lane(
+    lane: List[Check], stop: Optional[threading.Event] = None
+) -> List[Tuple[str, bool, str]]:
+    """Run checks one after another, buffering each check's output so lanes don't interleave.
+
+    When a stop event is given, the first failure sets it and every lane stops before its
+    next check.
+    """
+    results = []
+    for cmd, description in lane:
+        if stop is not None and stop.is_set():
+            break
+        buffer = io.StringIO()
+        if callable(cmd):
+            passed = cmd(description, buffer)
+        else:
+            passed = run_command(cmd, description, buffer)
+        results.append((description, passed, buffer.getvalue()))
+        if not passed and stop is not None:
+            stop.set()
+    return results
+
+
 def main():
     """Run comprehensive CI/CD compatibility checks."""
+    parser = argparse.ArgumentParser(description="Validate CI/CD compatibility before committing")
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop starting new checks after the first failure",
+    )
+    args = parser.parse_args()
+
     print("🚀 CI/CD Compatibility Validation")
     print("=" * 50)
 
     # Change to project directory
     project_dir = Path(__file__).parent.parent
     os.chdir(project_dir)
+    sys.path.insert(0, str(project_dir / "src"))
 
-    checks = [
+    checks: List[Check] = [
         # Code quality checks (same as CI/CD)
         ("python3 -m black --check src/ tests/", "Black code formatting check"),
         ("python3 -m isort --check-only src/ tests/", "Import sorting check"),
@@ -59,23 +120,40 @@ def main():
         ),
         # Test execution
         ("python3 -m pytest tests/redis_integration/ -v", "Redis integration tests"),
-        # Import validation
-        (
-            'python3 -c \'import sys; sys.path.insert(0, "src"); import redis_integration; print("✅ Redis integration imports successfully")\'',
-            "Import validation",
-        ),
+        # Import validation, run in-process to skip interpreter startup
+        (functools.partial(check_import, "redis_integration"), "Import validation"),
         # Redis type compatibility check
-        (
-            'python3 -c \'import redis; print(f"Redis version: {redis.__version__}"); print("✅ Redis client compatible")\'',
-            "Redis compatibility check",
-        ),
+        (functools.partial(check_import, "redis"), "Redis compatibility check"),
     ]
 
-    failed_checks = []
-
-    for cmd, description in checks:
-        if not run_command(cmd, description):
-            failed_checks.append(description)
+    # Test runs share coverage output and test data files, so they run in order in one lane
+    sequential_checks = [
+        check
+        for check in checks
+        if isinstance(check[0], str) and check[0].startswith("python3 -m pytest")
+    ]
+    independent_checks = [check for check in checks if check not in sequential_checks]
+
+    # The slow test lane is submitted first; the remaining checks each get their own lane
+    lanes = [sequential_checks] + [[check] for check in independent_checks]
+    outcomes = {}
+    stop = threading.Event() if args.fail_fast else None
+
+    with ThreadPoolExecutor(max_workers=min(len(lanes), os.cpu_count() or 1)) as executor:
+        futures = [executor.submit(run_check_lane, lane, stop) for lane in lanes]
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            for description, passed, output in future.result():
+                print(output, end="")
+                outcomes[description] = passed
+            if stop is not None and stop.is_set():
+                # Checks already running finish; lanes that haven't started are cancelled
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    # Report failures in declaration order regardless of completion order
+    failed_checks = [description for _, description in checks if outcomes.get(description) is False]
+    skipped_checks = [description for _, description in checks if description not in outcomes]
 
     print("\n" + "=" * 50)
     print("📊 VALIDATION SUMMARY")
@@ -85,6 +163,10 @@ def main():
         print(f"❌ {len(failed_checks)} checks FAILED:")
         for check in failed_checks:
             print(f"   - {check}")
+        if skipped_checks:
+            print(f"⏭️  {len(skipped_checks)} checks skipped (--fail-fast):")
+            for check in skipped_checks:
+                print(f"   - {check}")
         print("\n🚨 DO NOT COMMIT - Fix issues above first!")
         sys.exit(1)
     else:
@@ -10,13 +10,35 @@ Usage:
 """
 
 import argparse
+import functools
 import os
+import re
 import sys
 from typing import Any, Dict, Optional
 from urllib.parse import urlparse
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+
+    HAS_LIBYAML = True
+except ImportError:
+    from yaml import SafeLoader  # type: ignore[assignment]
+
+    HAS_LIBYAML = False
+
+
+# NAME=value assignments, one per line; comments and malformed lines never match
+_ENV_LINE_RE = re.compile(r"^[ \t]*([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t]*$", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=256)
+def _is_valid_url(url: str) -> bool:
+    """Return True if url has both a scheme and a network location."""
+    parsed = urlparse(url)
+    return bool(parsed.scheme and parsed.netloc)
+
 
 class ConfigValidator:
     """Validates configuration for unified match processor."""
@@ -24,22 +46,24 @@ class ConfigValidator:
     def __init__(self):
         self.errors = []
         self.warnings = []
+        # Snapshot of os.environ taken by validate_environment after loading the env file
+        self._env: Dict[str, str] = {}
 
     def validate_config_file(self, config_path: str) -> bool:
         """Validate YAML configuration file."""
         print(f"🔍 Validating configuration file: {config_path}")
 
-        if not os.path.exists(config_path):
+        try:
+            # LibYAML parses bytes directly, skipping the Python-side decode
+            with open(config_path, "rb") as f:
+                config = yaml.load(f, Loader=SafeLoader)
+        except FileNotFoundError:
             self.errors.append(f"Configuration file not found: {config_path}")
             return False
-
-        try:
-            with open(config_path, "r") as f:
-                config = yaml.safe_load(f)
         except yaml.YAMLError as e:
             self.errors.append(f"Invalid YAML syntax: {e}")
             return False
-        except Exception as e:
+        except OSError as e:
             self.errors.append(f"Failed to read config file: {e}")
             return False
 
@@ -57,9 +81,11 @@ class ConfigValidator:
         print("🔍 Validating environment variables")
 
         # Load environment file if provided
-        if env_file and os.path.exists(env_file):
+        if env_file:
             self._load_env_file(env_file)
 
+        self._env = dict(os.environ)
+
         # Required environment variables
         required_vars = [
             "PROCESSOR_MODE",
@@ -72,7 +98,7 @@ class ConfigValidator:
         ]
 
         for var in required_vars:
-            if not os.getenv(var):
+            if not self._env.get(var):
                 self.errors.append(f"Required environment variable not set: {var}")
 
         # Validate specific environment variables
@@ -87,13 +113,13 @@ class ConfigValidator:
         """Validate Docker Compose configuration."""
         print(f"🔍 Validating Docker Compose file: {compose_path}")
 
-        if not os.path.exists(compose_path):
+        try:
+            # LibYAML parses bytes directly, skipping the Python-side decode
+            with open(compose_path, "rb") as f:
+                compose = yaml.load(f, Loader=SafeLoader)
+        except FileNotFoundError:
             self.errors.append(f"Docker Compose file not found: {compose_path}")
             return False
-
-        try:
-            with open(compose_path, "r") as f:
-                compose = yaml.safe_load(f)
         except yaml.YAMLError as e:
             self.errors.append(f"Invalid Docker Compose YAML: {e}")
             return False
@@ -164,8 +190,7 @@ class ConfigValidator:
                 continue
 
             # Validate URL format
-            parsed = urlparse(url)
-            if not parsed.scheme or not parsed.netloc:
+            if not _is_valid_url(url):
                 self.errors.append(f"Invalid URL for service {service}: {url}")
 
             # Validate timeout
@@ -181,13 +206,13 @@ class ConfigValidator:
 
     def _validate_processor_mode(self):
         """Validate processor mode environment variable."""
-        mode = os.getenv("PROCESSOR_MODE")
+        mode = self._env.get("PROCESSOR_MODE")
         if mode and mode != "unified":
             self.errors.append(f"Invalid PROCESSOR_MODE: {mode}. Must be 'unified'")
 
     def _validate_run_mode(self):
         """Validate run mode environment variable."""
-        run_mode = os.getenv("RUN_MODE")
+        run_mode = self._env.get("RUN_MODE")
         if run_mode and run_mode not in ["service", "oneshot"]:
             self.errors.append(f"Invalid RUN_MODE: {run_mode}. Must be 'service' or 'oneshot'")
 
@@ -201,15 +226,13 @@ class ConfigValidator:
         ]
 
         for var in url_vars:
-            url = os.getenv(var)
-            if url:
-                parsed = urlparse(url)
-                if not parsed.scheme or not parsed.netloc:
-                    self.errors.append(f"Invalid URL in {var}: {url}")
+            url = self._env.get(var)
+            if url and not _is_valid_url(url):
+                self.errors.append(f"Invalid URL in {var}: {url}")
 
     def _validate_paths(self):
         """Validate path environment variables."""
-        data_folder = os.getenv("DATA_FOLDER")
+        data_folder = self._env.get("DATA_FOLDER")
         if data_folder and not os.path.isabs(data_folder):
             self.warnings.append(f"DATA_FOLDER should be absolute path: {data_folder}")
 
@@ -239,11 +262,12 @@ class ConfigValidator:
         """Load environment variables from file."""
         try:
             with open(env_file, "r") as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#") and "=" in line:
-                        key, value = line.split("=", 1)
-                        os.environ[key] = value
+                text = f.read()
+            for match in _ENV_LINE_RE.finditer(text):
+                os.environ[match.group(1)] = match.group(2)
+        except FileNotFoundError:
+            # The env file is optional; validate the current environment as-is
+            return
         except Exception as e:
             self.warnings.append(f"Failed to load environment file {env_file}: {e}")
 
@@ -290,6 +314,10 @@ def main():
 
     args = parser.parse_args()
 
+    if not HAS_LIBYAML:
+        print("⚠️  LibYAML not available; falling back to the slower pure-Python YAML parser")
+        print("   Install libyaml-dev and reinstall PyYAML to enable the C loader")
+
     validator = ConfigValidator()
 
     # Validate configuration file
@@ -5,37 +5,175 @@ Orchestrates all integration testing and deployment validation
 Issue #54: Final Integration Testing and Production Deployment Validation
 """
 
-import argparse
-import json
+import contextlib
+import importlib.util
+import io
 import logging
+import os
+import re
 import subprocess
 import sys
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# pytest-xdist spreads a suite across worker processes when installed
+HAS_XDIST = importlib.util.find_spec("xdist") is not None
+
+# Suites that run pytest; they share the main thread and pytest's per-directory state
+PYTEST_SUITES = ("integration", "performance")
+
+# Summary lines printed by the deployment validation scripts
+_VALIDATION_RE = re.compile(r"^(Total validations|Passed|Failed):\s*(\d+)\s*$", re.M)
+
+# Repository root, two levels above scripts/validation/
+DEFAULT_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# How often a running command checks whether fail-fast has stopped the run
+STOP_POLL_INTERVAL = 0.2  # seconds
+
+# Passing suites keep only this much of their output; pytest's summary is at the end
+OUTPUT_TAIL_CHARS = 64 * 1024
+
+# Options shared by every pytest suite run; counts come from structured results, not the text,
+# and coverage is enforced by the full test run rather than by each suite
+PYTEST_ARGS = ("-q", "--tb=short", "--no-header", "--no-cov")
+
+# pytest cache modes: "ff" runs last-failed tests first, "lf" runs only them (never use in CI)
+PYTEST_MODE_ARGS = {"full": (), "ff": ("--ff",), "lf": ("--lf",)}
+
+# Result keys for the (run, passed, failed) counts of each kind of suite
+TEST_COUNT_KEYS = ("tests_run", "tests_passed", "tests_failed")
+VALIDATION_COUNT_KEYS = ("validations_run", "validations_passed", "validations_failed")
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 logger = logging.getLogger(__name__)
 
 
+def _parse_junit(report_path: str) -> Tuple[int, int, int]:
+    """Return (run, passed, failed) from a pytest JUnit XML report; errors count as failed."""
+    import xml.etree.ElementTree as ET
+
+    passed = failed = 0
+    try:
+        for _, elem in ET.iterparse(report_path):
+            if elem.tag != "testsuite":
+                continue
+            suite_failed = int(elem.get("failures", 0)) + int(elem.get("errors", 0))
+            failed += suite_failed
+            passed += int(elem.get("tests", 0)) - suite_failed - int(elem.get("skipped", 0))
+            elem.clear()
+    except (OSError, ET.ParseError) as e:
+        logger.warning(f"Could not read JUnit report {report_path}: {e}")
+    return passed + failed, passed, failed
+
+
+def _parse_validation(stdout: str) -> Tuple[int, int, int]:
+    """Return (run, passed, failed) from a validation script's summary lines."""
+    values = {label: int(count) for label, count in _VALIDATION_RE.findall(stdout)}
+    return values.get("Total validations", 0), values.get("Passed", 0), values.get("Failed", 0)
+
+
+class SuiteCancelled(Exception):
+    """Raised when a running suite command is stopped because another suite failed."""
+
+
+def _skipped_result(suite_name: str, reason: str) -> Dict[str, Any]:
+    """Build the result recorded for a suite that was skipped or cancelled by fail-fast."""
+    return {"name": suite_name, "success": False, "skipped": True, "reason": reason}
+
+
+@contextlib.contextmanager
+def _default_root_logging() -> Iterator[None]:
+    """Reset the root logger to interpreter defaults, keeping this script's own log output.
+
+    Tests then see the same logging setup in-process as they would in a fresh interpreter.
+    """
+    root = logging.getLogger()
+    saved_level, saved_handlers = root.level, root.handlers[:]
+    logger.setLevel(root.getEffectiveLevel())
+    logger.handlers[:] = saved_handlers
+    logger.propagate = False
+    root.handlers.clear()
+    root.setLevel(logging.WARNING)
+    try:
+        yield
+    finally:
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+        logger.handlers.clear()
+        logger.propagate = True
+        logger.setLevel(logging.NOTSET)
+
+
+class ResultCapture:
+    """pytest plugin that records outcome counts straight from the terminal reporter."""
+
+    def __init__(self):
+        self.counts: Tuple[int, int, int] = (0, 0, 0)
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        """Record (run, passed, failed) counts; errors count as failed."""
+        passed = len(terminalreporter.stats.get("passed", []))
+        failed = len(terminalreporter.stats.get("failed", [])) + len(
+            terminalreporter.stats.get("error", [])
+        )
+        self.counts = (passed + failed, passed, failed)
+
+
 class IntegrationValidationRunner:
     """Orchestrates comprehensive integration testing and validation."""
 
-    def __init__(self, project_root: str = None):
-        self.project_root = (
-            Path(project_root) if project_root else Path(__file__).parent.parent.parent
-        )
+    def __init__(
+        self,
+        project_root: str = None,
+        jobs: Union[int, str] = "auto",
+        subprocess_pytest: bool = False,
+        full_output: bool = False,
+        pytest_mode: str = "full",
+    ):
+        self.project_root = Path(project_root) if project_root else DEFAULT_PROJECT_ROOT
+        # pytest-xdist worker count: "auto" uses one worker per core
+        self.jobs = jobs
+        # Run pytest suites in a child interpreter instead of in-process, for isolation
+        self.subprocess_pytest = subprocess_pytest
+        # Keep the complete output of passing suites, not just the tail
+        self.full_output = full_output
+        # Set while a fail-fast run is in progress; signals lanes to stop after a failure
+        self._stop: Optional[threading.Event] = None
+
+        # Fixed for the runner's lifetime, so built once rather than per command
+        self._python = sys.executable
+        self._project_root_str = os.fspath(self.project_root)
+        self._pytest_options: Tuple[str, ...] = PYTEST_ARGS
+        if HAS_XDIST:
+            # loadfile keeps each file on one worker so module fixtures are set up only once
+            self._pytest_options += ("-n", str(self.jobs), "--dist=loadfile")
+        # Reorder or narrow the run using pytest's record of last-failed tests
+        self._pytest_options += PYTEST_MODE_ARGS[pytest_mode]
+
         self.results = {
-            "timestamp": datetime.now().isoformat(),
-            "project_root": str(self.project_root),
+            "timestamp": None,  # set when the run starts
+            "project_root": self._project_root_str,
             "test_suites": {},
             "overall_success": True,
             "summary": {
                 "total_suites": 0,
                 "passed_suites": 0,
                 "failed_suites": 0,
+                "skipped_suites": 0,
                 "total_tests": 0,
                 "passed_tests": 0,
                 "failed_tests": 0,
@@ -46,254 +184,262 @@ class IntegrationValidationRunner:
         self, command: List[str], cwd: str = None, timeout: int = 300
     ) -> Tuple[bool, str, str]:
         """Run a command and return success status, stdout, and stderr."""
-        try:
-            if cwd is None:
-                cwd = str(self.project_root)
+        if cwd is None:
+            cwd = self._project_root_str
 
-            logger.info(f"Running command: {' '.join(command)}")
+        logger.info(f"Running command: {' '.join(command)}")
 
-            result = subprocess.run(
-                command, cwd=cwd, capture_output=True, text=True, timeout=timeout
+        try:
+            process = subprocess.Popen(
+                command,
+                cwd=cwd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=1,
+                text=True,
             )
-
-            success = result.returncode == 0
-            return success, result.stdout, result.stderr
-
-        except subprocess.TimeoutExpired:
-            return False, "", f"Command timed out after {timeout} seconds"
         except Exception as e:
             return False, "", f"Command failed: {e}"
 
-    def run_integration_tests(self) -> Tuple[bool, Dict[str, Any]]:
-        """Run integration test suite."""
-        logger.info("Running integration tests...")
+        # Drain both pipes as output arrives so a chatty process never blocks on a full pipe
+        stdout_lines: List[str] = []
+        stderr_lines: List[str] = []
+        readers = [
+            threading.Thread(target=self._stream_output, args=(process.stdout, stdout_lines)),
+            threading.Thread(target=self._stream_output, args=(process.stderr, stderr_lines)),
+        ]
+        for reader in readers:
+            reader.start()
+
+        error = None
+        cancelled = False
+        deadline = time.monotonic() + timeout
+        try:
+            # Wait in short slices so a fail-fast stop can cancel the command while it runs
+            while process.poll() is None:
+                if self._stop is not None and self._stop.is_set():
+                    cancelled = True
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    error = f"Command timed out after {timeout} seconds"
+                    break
+                try:
+                    process.wait(timeout=min(remaining, STOP_POLL_INTERVAL))
+                except subprocess.TimeoutExpired:
+                    pass
+        except Exception as e:
+            error = f"Command failed: {e}"
+        if cancelled or error is not None:
+            process.kill()
+            process.wait()
+
+        # Readers finish once the pipes close, so the output is complete after joining
+        for reader in readers:
+            reader.join()
+
+        if cancelled:
+            raise SuiteCancelled(f"Cancelled after another suite failed: {' '.join(command)}")
+        if error is not None:
+            return False, "".join(stdout_lines), error
+        return process.returncode == 0, "".join(stdout_lines), "".join(stderr_lines)
+
+    @staticmethod
+    def _stream_output(stream: IO[str], lines: List[str]) -> None:
+        """Collect lines from a subprocess pipe, echoing them at DEBUG level as they arrive."""
+        with stream:
+            for line in stream:
+                logger.debug(line.rstrip("\n"))
+                lines.append(line)
+
+    def _execute_suite(
+        self,
+        display_name: str,
+        execute: Callable[[], Tuple[bool, str, str, Tuple[int, int, int]]],
+        count_keys: Tuple[str, str, str],
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """Run a suite and build its result from (success, stdout, stderr, counts)."""
+        logger.info(f"Running {display_name}...")
 
         test_result = {
-            "name": "Integration Tests",
+            "name": display_name,
             "success": False,
-            "tests_run": 0,
-            "tests_passed": 0,
-            "tests_failed": 0,
+            **dict.fromkeys(count_keys, 0),
             "execution_time": 0,
             "output": "",
             "errors": [],
         }
 
-        start_time = time.time()
-
-        # Run integration tests with pytest
-        success, stdout, stderr = self.run_command(
-            [
-                sys.executable,
-                "-m",
-                "pytest",
-                "tests/integration/",
-                "-v",
-                "--tb=short",
-                "--no-header",
-            ]
-        )
+        start_time = time.perf_counter()
+        success, stdout, stderr, counts = execute()
 
-        test_result["execution_time"] = time.time() - start_time
+        test_result["execution_time"] = time.perf_counter() - start_time
         test_result["success"] = success
-        test_result["output"] = stdout
+        # Failures keep everything; a passing suite only needs its tail (summary, warnings)
+        test_result["output"] = (
+            stdout if self.full_output or not success else stdout[-OUTPUT_TAIL_CHARS:]
+        )
 
         if stderr:
             test_result["errors"].append(stderr)
 
-        # Parse pytest output for test counts
-        if stdout:
-            lines = stdout.split("\n")
-            for line in lines:
-                if "passed" in line or "failed" in line:
-                    # Try to extract test counts from pytest summary
-                    if "passed" in line and "failed" not in line:
-                        try:
-                            passed = int(line.split()[0])
-                            test_result["tests_passed"] = passed
-                            test_result["tests_run"] = passed
-                        except (ValueError, IndexError):
-                            pass
-                    elif "failed" in line:
-                        try:
-                            # Parse "X failed, Y passed" format
-                            parts = line.split()
-                            for i, part in enumerate(parts):
-                                if part == "failed" and i > 0:
-                                    test_result["tests_failed"] = int(parts[i - 1])
-                                elif part == "passed" and i > 0:
-                                    test_result["tests_passed"] = int(parts[i - 1])
-                            test_result["tests_run"] = (
-                                test_result["tests_failed"] + test_result["tests_passed"]
-                            )
-                        except (ValueError, IndexError):
-                            pass
-
+        test_result.update(zip(count_keys, counts))
         return success, test_result
 
-    def run_performance_tests(self) -> Tuple[bool, Dict[str, Any]]:
-        """Run performance benchmark tests."""
-        logger.info("Running performance benchmark tests...")
+    def _pytest_args(self, test_path: str) -> List[str]:
+        """Build the pytest arguments for one test directory."""
+        return [test_path, *self._pytest_options]
 
-        test_result = {
-            "name": "Performance Benchmarks",
-            "success": False,
-            "tests_run": 0,
-            "tests_passed": 0,
-            "tests_failed": 0,
-            "execution_time": 0,
-            "output": "",
-            "errors": [],
-        }
+    def _run_pytest(self, test_path: str) -> Tuple[bool, str, str, Tuple[int, int, int]]:
+        """Run one pytest suite, in this interpreter unless subprocess isolation is requested."""
+        test_dir = self.project_root / test_path
+        if not test_dir.is_dir():
+            return False, "", f"Test directory not found: {test_dir}", (0, 0, 0)
 
-        start_time = time.time()
+        if self.subprocess_pytest:
+            fd, report_path = tempfile.mkstemp(suffix=".xml", prefix="pytest-junit-")
+            os.close(fd)
+            try:
+                command = [
+                    self._python,
+                    "-m",
+                    "pytest",
+                    *self._pytest_args(test_path),
+                    f"--junit-xml={report_path}",
+                ]
+                success, stdout, stderr = self.run_command(command)
+                return success, stdout, stderr, _parse_junit(report_path)
+            finally:
+                os.unlink(report_path)
+
+        import pytest
+
+        logger.info(f"Running pytest in-process: {' '.join(self._pytest_args(test_path))}")
+        capture = ResultCapture()
+        output = io.StringIO()
+        # pytest resolves its config and test paths against the working directory
+        previous_cwd = os.getcwd()
+        try:
+            os.chdir(self.project_root)
+            with contextlib.redirect_stdout(output), _default_root_logging():
+                exit_code = pytest.main(self._pytest_args(test_path), plugins=[capture])
+        finally:
+            os.chdir(previous_cwd)
+        return exit_code == 0, output.getvalue(), "", capture.counts
+
+    def _run_validation_script(
+        self, script_name: str
+    ) -> Tuple[bool, str, str, Tuple[int, int, int]]:
+        """Run one of the validation scripts and parse its summary counts."""
+        validation_script = self.project_root / "scripts" / "validation" / script_name
+        if not validation_script.is_file():
+            return False, "", f"Validation script not found: {validation_script}", (0, 0, 0)
 
-        # Run performance tests
         success, stdout, stderr = self.run_command(
-            [
-                sys.executable,
-                "-m",
-                "pytest",
-                "tests/performance/",
-                "-v",
-                "--tb=short",
-                "--no-header",
-            ]
+            [self._python, os.fspath(validation_script), "--verbose"]
         )
+        return success, stdout, stderr, _parse_validation(stdout)
 
-        test_result["execution_time"] = time.time() - start_time
-        test_result["success"] = success
-        test_result["output"] = stdout
-
-        if stderr:
-            test_result["errors"].append(stderr)
-
-        # Parse test counts (similar to integration tests)
-        if stdout:
-            lines = stdout.split("\n")
-            for line in lines:
-                if "passed" in line or "failed" in line:
-                    if "passed" in line and "failed" not in line:
-                        try:
-                            passed = int(line.split()[0])
-                            test_result["tests_passed"] = passed
-                            test_result["tests_run"] = passed
-                        except (ValueError, IndexError):
-                            pass
+    def run_integration_tests(self) -> Tuple[bool, Dict[str, Any]]:
+        """Run integration test suite."""
+        return self._execute_suite(
+            "Integration Tests",
+            lambda: self._run_pytest("tests/integration/"),
+            TEST_COUNT_KEYS,
+        )
 
-        return success, test_result
+    def run_performance_tests(self) -> Tuple[bool, Dict[str, Any]]:
+        """Run performance benchmark tests."""
+        return self._execute_suite(
+            "Performance Benchmarks",
+            lambda: self._run_pytest("tests/performance/"),
+            TEST_COUNT_KEYS,
+        )
 
     def run_deployment_validation(self) -> Tuple[bool, Dict[str, Any]]:
         """Run deployment validation."""
-        logger.info("Running deployment validation...")
-
-        test_result = {
-            "name": "Deployment Validation",
-            "success": False,
-            "validations_run": 0,
-            "validations_passed": 0,
-            "validations_failed": 0,
-            "execution_time": 0,
-            "output": "",
-            "errors": [],
-        }
-
-        start_time = time.time()
-
-        # Run deployment validation script
-        validation_script = self.project_root / "scripts" / "validation" / "validate_deployment.py"
-
-        success, stdout, stderr = self.run_command(
-            [sys.executable, str(validation_script), "--verbose"]
+        return self._execute_suite(
+            "Deployment Validation",
+            lambda: self._run_validation_script("validate_deployment.py"),
+            VALIDATION_COUNT_KEYS,
         )
 
-        test_result["execution_time"] = time.time() - start_time
-        test_result["success"] = success
-        test_result["output"] = stdout
-
-        if stderr:
-            test_result["errors"].append(stderr)
-
-        # Parse validation output
-        if stdout:
-            lines = stdout.split("\n")
-            for line in lines:
-                if "Total validations:" in line:
-                    try:
-                        test_result["validations_run"] = int(line.split(":")[1].strip())
-                    except (ValueError, IndexError):
-                        pass
-                elif "Passed:" in line:
-                    try:
-                        test_result["validations_passed"] = int(line.split(":")[1].strip())
-                    except (ValueError, IndexError):
-                        pass
-                elif "Failed:" in line:
-                    try:
-                        test_result["validations_failed"] = int(line.split(":")[1].strip())
-                    except (ValueError, IndexError):
-                        pass
-
-        return success, test_result
-
     def run_production_validation(self) -> Tuple[bool, Dict[str, Any]]:
         """Run production deployment validation."""
-        logger.info("Running production deployment validation...")
-
-        test_result = {
-            "name": "Production Validation",
-            "success": False,
-            "validations_run": 0,
-            "validations_passed": 0,
-            "validations_failed": 0,
-            "execution_time": 0,
-            "output": "",
-            "errors": [],
-        }
-
-        start_time = time.time()
-
-        # Run production validation script
-        validation_script = (
-            self.project_root / "scripts" / "validation" / "production_deployment_validator.py"
+        return self._execute_suite(
+            "Production Validation",
+            lambda: self._run_validation_script("production_deployment_validator.py"),
+            VALIDATION_COUNT_KEYS,
         )
 
-        success, stdout, stderr = self.run_command(
-            [sys.executable, str(validation_script), "--verbose"]
-        )
-
-        test_result["execution_time"] = time.time() - start_time
-        test_result["success"] = success
-        test_result["output"] = stdout
-
-        if stderr:
-            test_result["errors"].append(stderr)
-
-        # Parse validation output (similar to deployment validation)
-        if stdout:
-            lines = stdout.split("\n")
-            for line in lines:
-                if "Total validations:" in line:
-                    try:
-                        test_result["validations_run"] = int(line.split(":")[1].strip())
-                    except (ValueError, IndexError):
-                        pass
-                elif "Passed:" in line:
-                    try:
-                        test_result["validations_passed"] = int(line.split(":")[1].strip())
-                    except (ValueError, IndexError):
-                        pass
-                elif "Failed:" in line:
-                    try:
-                        test_result["validations_failed"] = int(line.split(":")[1].strip())
-                    except (ValueError, IndexError):
-                        pass
+    def _run_suite(
+        self, suite_name: str, suite_func: Callable[[], Tuple[bool, Dict[str, Any]]]
+    ) -> Tuple[bool, Dict[str, Any]]:
+        """Run one test suite, turning an unexpected error into a failed result."""
+        logger.info(f"Running {suite_name} test suite...")
 
-        return success, test_result
-
-    def run_all_validations(self, skip_docker: bool = False) -> Dict[str, Any]:
+        try:
+            return suite_func()
+        except SuiteCancelled as e:
+            logger.info(f"⏭️  {suite_name} test suite cancelled (fail-fast)")
+            return False, _skipped_result(suite_name, str(e))
+        except Exception as e:
+            logger.error(f"❌ {suite_name} test suite encountered an error: {e}")
+            return False, {"name": suite_name, "success": False, "error": str(e)}
+
+    def _run_suite_lane(
+        self, lane: List[Tuple[str, Callable[[], Tuple[bool, Dict[str, Any]]]]]
+    ) -> List[Tuple[str, Tuple[bool, Dict[str, Any]]]]:
+        """Run test suites one after another, returning (suite_name, outcome) pairs.
+
+        In fail-fast mode the first failure stops every lane before its next suite.
+        """
+        outcomes = []
+        for suite_name, suite_func in lane:
+            if self._stop is not None and self._stop.is_set():
+                outcome = (False, _skipped_result(suite_name, "Skipped after another suite failed"))
+            else:
+                outcome = self._run_suite(suite_name, suite_func)
+                if self._stop is not None and not outcome[0] and not outcome[1].get("skipped"):
+                    logger.error("Fail-fast triggered, skipping remaining suites")
+                    self._stop.set()
+            outcomes.append((suite_name, outcome))
+        return outcomes
+
+    def _record_suite(self, suite_name: str, success: bool, result: Dict[str, Any]) -> None:
+        """Add a suite's result to the report and summary counters."""
+        self.results["test_suites"][suite_name] = result
+
+        # Update summary
+        self.results["summary"]["total_suites"] += 1
+        if result.get("skipped"):
+            self.results["summary"]["skipped_suites"] += 1
+            self.results["overall_success"] = False
+            return
+        if success:
+            self.results["summary"]["passed_suites"] += 1
+            logger.info(f"✅ {suite_name} test suite passed")
+        else:
+            self.results["summary"]["failed_suites"] += 1
+            self.results["overall_success"] = False
+            logger.error(f"❌ {suite_name} test suite failed")
+
+        # Update test counts
+        if "tests_run" in result:
+            self.results["summary"]["total_tests"] += result["tests_run"]
+            self.results["summary"]["passed_tests"] += result["tests_passed"]
+            self.results["summary"]["failed_tests"] += result["tests_failed"]
+        elif "validations_run" in result:
+            self.results["summary"]["total_tests"] += result["validations_run"]
+            self.results["summary"]["passed_tests"] += result["validations_passed"]
+            self.results["summary"]["failed_tests"] += result["validations_failed"]
+
+    def run_all_validations(
+        self, skip_docker: bool = False, serial: bool = False, fail_fast: bool = False
+    ) -> Dict[str, Any]:
         """Run all integration testing and validation suites."""
         logger.info("Starting comprehensive integration and validation testing...")
+        self.results["timestamp"] = datetime.now().isoformat()
 
         # Test suites to run
         test_suites = [
@@ -310,52 +456,42 @@ class IntegrationValidationRunner:
                 ]
             )
 
-        # Run each test suite
-        for suite_name, suite_func in test_suites:
-            logger.info(f"Running {suite_name} test suite...")
+        if serial:
+            main_lane, lanes = test_suites, []
+        else:
+            # The pytest suites run one after another (pytest's cache and, in-process, the
+            # interpreter are shared); each validation script gets its own lane
+            main_lane = [suite for suite in test_suites if suite[0] in PYTEST_SUITES]
+            lanes = [[suite] for suite in test_suites if suite not in main_lane]
 
-            try:
-                success, result = suite_func()
-                self.results["test_suites"][suite_name] = result
-
-                # Update summary
-                self.results["summary"]["total_suites"] += 1
-                if success:
-                    self.results["summary"]["passed_suites"] += 1
-                    logger.info(f"✅ {suite_name} test suite passed")
-                else:
-                    self.results["summary"]["failed_suites"] += 1
-                    self.results["overall_success"] = False
-                    logger.error(f"❌ {suite_name} test suite failed")
-
-                # Update test counts
-                if "tests_run" in result:
-                    self.results["summary"]["total_tests"] += result["tests_run"]
-                    self.results["summary"]["passed_tests"] += result["tests_passed"]
-                    self.results["summary"]["failed_tests"] += result["tests_failed"]
-                elif "validations_run" in result:
-                    self.results["summary"]["total_tests"] += result["validations_run"]
-                    self.results["summary"]["passed_tests"] += result["validations_passed"]
-                    self.results["summary"]["failed_tests"] += result["validations_failed"]
-
-            except Exception as e:
-                logger.error(f"❌ {suite_name} test suite encountered an error: {e}")
-                self.results["test_suites"][suite_name] = {
-                    "name": suite_name,
-                    "success": False,
-                    "error": str(e),
-                }
-                self.results["summary"]["total_suites"] += 1
-                self.results["summary"]["failed_suites"] += 1
-                self.results["overall_success"] = False
+        self._stop = threading.Event() if fail_fast else None
+        try:
+            with ThreadPoolExecutor(max_workers=max(len(lanes), 1)) as executor:
+                futures = [executor.submit(self._run_suite_lane, lane) for lane in lanes]
+                # In-process tests install signal handlers, which only works on the main thread
+                outcomes = dict(self._run_suite_lane(main_lane))
+                for future in futures:
+                    outcomes.update(future.result())
+        finally:
+            self._stop = None
+
+        # Record results in declaration order regardless of completion order
+        for suite_name, _ in test_suites:
+            self._record_suite(suite_name, *outcomes[suite_name])
 
         return self.results
 
-    def save_results(self, output_file: str) -> None:
+    def save_results(self, output_file: Union[str, os.PathLike]) -> None:
         """Save test results to a file."""
         try:
-            with open(output_file, "w") as f:
-                json.dump(self.results, f, indent=2)
+            if HAS_ORJSON:
+                with open(output_file, "wb") as f:
+                    f.write(orjson.dumps(self.results, option=orjson.OPT_INDENT_2))
+            else:
+                import json
+
+                with open(output_file, "w") as f:
+                    json.dump(self.results, f, indent=2)
             logger.info(f"Test results saved to {output_file}")
         except Exception as e:
             logger.warning(f"Could not save test results: {e}")
@@ -371,6 +507,8 @@ class IntegrationValidationRunner:
         print(f"Test Suites: {self.results['summary']['total_suites']}")
         print(f"  Passed: {self.results['summary']['passed_suites']}")
         print(f"  Failed: {self.results['summary']['failed_suites']}")
+        if self.results["summary"]["skipped_suites"]:
+            print(f"  Skipped: {self.results['summary']['skipped_suites']}")
         print()
         print(f"Total Tests/Validations: {self.results['summary']['total_tests']}")
         print(f"  Passed: {self.results['summary']['passed_tests']}")
@@ -381,14 +519,27 @@ class IntegrationValidationRunner:
         if not self.results["overall_success"]:
             print("\nFailed Test Suites:")
             for suite_name, suite_result in self.results["test_suites"].items():
-                if not suite_result.get("success", False):
+                if not suite_result.get("success", False) and not suite_result.get("skipped"):
                     print(f"  - {suite_name}: {suite_result.get('name', 'Unknown')}")
                     if "errors" in suite_result and suite_result["errors"]:
                         for error in suite_result["errors"]:
                             print(f"    Error: {error}")
 
+            skipped = [
+                name
+                for name, result in self.results["test_suites"].items()
+                if result.get("skipped")
+            ]
+            if skipped:
+                print("\nSkipped Test Suites (--fail-fast):")
+                for suite_name in skipped:
+                    print(f"  - {suite_name}: {self.results['test_suites'][suite_name]['reason']}")
+
 
 def main():
+    # Imported here so library users of the runner don't pay for CLI-only modules
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Run comprehensive integration and validation tests"
     )
@@ -397,18 +548,65 @@ def main():
     parser.add_argument(
         "--skip-docker", action="store_true", help="Skip Docker-dependent validations"
     )
+    parser.add_argument(
+        "--jobs",
+        default="auto",
+        help="pytest-xdist workers per test suite: a number or 'auto' (default: auto)",
+    )
+    parser.add_argument(
+        "--serial", action="store_true", help="Run test suites one at a time (for debugging)"
+    )
+    parser.add_argument(
+        "--subprocess-pytest",
+        action="store_true",
+        help="Run pytest suites in a separate interpreter instead of in-process",
+    )
+    parser.add_argument(
+        "--full-output",
+        action="store_true",
+        help="Keep the complete output of passing suites instead of only its tail",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop running test suites after the first failure",
+    )
+    parser.add_argument(
+        "--mode",
+        choices=sorted(PYTEST_MODE_ARGS),
+        default="full" if os.environ.get("CI") else "ff",
+        help="pytest run mode: full, ff (last-failed first) or lf (last-failed only; "
+        "never in CI). Default: full in CI, ff otherwise",
+    )
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging")
 
     args = parser.parse_args()
 
+    if args.jobs != "auto" and not args.jobs.isdigit():
+        parser.error("--jobs must be a non-negative integer or 'auto'")
+    if args.mode == "lf" and os.environ.get("CI"):
+        logger.warning(
+            "--mode lf only runs previously failed tests; a green result is not a full run"
+        )
+    if not HAS_XDIST:
+        logger.info("pytest-xdist not installed; test suites will run in a single process")
+
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
 
     # Create test runner
-    runner = IntegrationValidationRunner(args.project_root)
+    runner = IntegrationValidationRunner(
+        args.project_root,
+        jobs=args.jobs,
+        subprocess_pytest=args.subprocess_pytest,
+        full_output=args.full_output,
+        pytest_mode=args.mode,
+    )
 
     # Run all validations
-    results = runner.run_all_validations(args.skip_docker)
+    results = runner.run_all_validations(
+        args.skip_docker, serial=args.serial, fail_fast=args.fail_fast
+    )
 
     # Save results if requested
     if args.output:
@@ -1,23 +1,16 @@
 """Main application orchestrator for match list processing."""
 
-import json
 import logging
 import signal
 import sys
-import time
+import threading
 from types import FrameType
 from typing import Optional
 
 from .config import settings
-from .core.data_manager import MatchDataManager
+from .core.data_manager import serialize_matches
 from .core.match_comparator import MatchComparator
-from .core.match_processor import MatchProcessor
 from .custom_types import MatchDict_Dict
-from .services.api_client import DockerNetworkApiClient
-from .services.avatar_service import WhatsAppAvatarService
-from .services.storage_service import GoogleDriveStorageService
-from .utils.description_generator import generate_whatsapp_description
-from .web.health_server import create_health_server
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +20,19 @@ class MatchListProcessorApp:
 
     def __init__(self) -> None:
         """Initialize the application with all required services."""
+        # Set once shutdown() has run, so repeated calls (signal, error path, finally) are no-ops
+        self._shutdown_done = threading.Event()
+
+        # Imported here so importing the module (e.g. for setup_logging) skips the
+        # requests and FastAPI stacks behind the services and the health server
+        from .core.data_manager import MatchDataManager
+        from .core.match_processor import MatchProcessor
+        from .services.api_client import DockerNetworkApiClient
+        from .services.avatar_service import WhatsAppAvatarService
+        from .services.storage_service import GoogleDriveStorageService
+        from .utils.description_generator import generate_whatsapp_description
+        from .web.health_server import create_health_server
+
         self.data_manager = MatchDataManager()
         self.api_client = DockerNetworkApiClient()
         self.avatar_service = WhatsAppAvatarService()
@@ -47,11 +53,15 @@ class MatchListProcessorApp:
     def _signal_handler(self, signum: int, frame: Optional[FrameType]) -> None:  # noqa: ARG002
         """Handle shutdown signals gracefully."""
         logger.info(f"Received signal {signum}, shutting down gracefully...")
-        self.shutdown()
+        # Only unwind here; run()'s finally block does the actual cleanup outside the handler
         sys.exit(0)
 
     def shutdown(self) -> None:
-        """Shutdown the application gracefully."""
+        """Shutdown the application gracefully; calls after the first are no-ops."""
+        if self._shutdown_done.is_set():
+            return
+        self._shutdown_done.set()
+
         logger.info("Shutting down health server...")
         if hasattr(self, "health_server"):
             self.health_server.stop_server()
@@ -60,17 +70,17 @@ class MatchListProcessorApp:
         """Run the main application logic."""
         logger.info("Starting match list processor...")
 
-        # Start health server
-        logger.info("Starting health server on port 8000...")
-        self.health_server.start_server()
-
-        # Give health server time to start
-        time.sleep(2)
-
-        if not self.health_server.is_running():
-            logger.warning("Health server failed to start, but continuing with main processing...")
-
         try:
+            # Start health server; inside the try so a signal during startup still stops it
+            logger.info("Starting health server on port 8000...")
+            self.health_server.start_server()
+
+            # Wait for the health server to come up instead of sleeping a fixed 2 seconds
+            if not self.health_server.wait_until_ready(timeout=2.0):
+                logger.warning(
+                    "Health server failed to start, but continuing with main processing..."
+                )
+
             # Load and parse previous matches
             previous_matches_dict = self._load_previous_matches()
             logger.info(f"Loaded previous matches data: {len(previous_matches_dict)} matches.")
@@ -92,9 +102,8 @@ class MatchListProcessorApp:
             logger.info("Match list processor execution finished.")
 
         except Exception as e:
-            logger.error(f"Unexpected error: {e}")
-            logger.exception("Stack trace:")
-            self.shutdown()
+            # One record carrying both the message and the traceback
+            logger.exception(f"Unexpected error: {e}")
             sys.exit(1)
         finally:
             # Ensure graceful shutdown
@@ -109,12 +118,7 @@ class MatchListProcessorApp:
     def _fetch_current_matches(self) -> MatchDict_Dict:
         """Fetch current matches from API."""
         logger.info("\n--- Fetching Current Matches List ---")
-        current_matches_list = self.api_client.fetch_matches_list()
-
-        if not current_matches_list:
-            return {}
-
-        return MatchComparator.convert_to_dict(current_matches_list)
+        return self.api_client.fetch_matches_dict()
 
     def _process_match_changes(
         self, previous_matches: MatchDict_Dict, current_matches: MatchDict_Dict
@@ -169,33 +173,29 @@ class MatchListProcessorApp:
         """Process modified matches."""
         if common_ids:
             logger.info(f"Checking for MODIFIED matches among {len(common_ids)} common matches...")
-            modified_count = 0
-
-            for match_id in common_ids:
-                prev_match = previous_matches[match_id]
-                curr_match = current_matches[match_id]
+            modified = MatchComparator.find_modified_matches(
+                previous_matches, current_matches, common_ids
+            )
 
-                if MatchComparator.is_match_modified(prev_match, curr_match):
-                    modified_count += 1
-                    self.match_processor.process_match(
-                        curr_match,
-                        match_id,
-                        is_new=False,
-                        previous_match_data=prev_match,
-                    )
+            for match_id, prev_match, curr_match in modified:
+                self.match_processor.process_match(
+                    curr_match,
+                    match_id,
+                    is_new=False,
+                    previous_match_data=prev_match,
+                )
 
             logger.info(
-                f"Found {modified_count} modified matches out of {len(common_ids)} common matches."
+                f"Found {len(modified)} modified matches out of {len(common_ids)} common matches."
             )
         else:
             logger.info("No common matches found between previous and current lists.")
 
     def _save_current_matches(self, current_matches: MatchDict_Dict) -> None:
         """Save current matches for future comparison."""
-        # Convert back to list format for JSON serialization
-        current_matches_list = list(current_matches.values())
-        raw_json_string = json.dumps(current_matches_list, ensure_ascii=False)
-        self.data_manager.save_current_matches_raw_json(raw_json_string)
+        # Serialize straight to UTF-8 bytes; the file is written without a str copy
+        raw_json = serialize_matches(list(current_matches.values()))
+        self.data_manager.save_current_matches_raw_json(raw_json)
         logger.info("Current matches saved as raw JSON for future comparison.")
 
 
@@ -5,11 +5,10 @@ import logging
 import os
 import signal
 import sys
-import threading
 import time
 from contextlib import asynccontextmanager
 from types import FrameType
-from typing import Optional
+from typing import Any, Dict, Optional, Tuple
 
 try:
     from typing import AsyncGenerator
@@ -25,14 +24,38 @@ from src.core.data_manager import MatchDataManager
 from src.core.match_processor import MatchProcessor
 from src.services.api_client import DockerNetworkApiClient
 from src.services.avatar_service import WhatsAppAvatarService
-from src.services.health_service import HealthService
+from src.services.health_service import DependencyStatus, HealthService, HealthStatus
 from src.services.storage_service import GoogleDriveStorageService
 from src.services.webhook_service import WebhookProcessingService
 from src.utils.description_generator import generate_whatsapp_description
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import uvloop
+
+    HAS_UVLOOP = True
+except ImportError:
+    HAS_UVLOOP = False
+
 logger = logging.getLogger(__name__)
 
 
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when it is installed."""
+
+    def render(self, content: Any) -> bytes:
+        """Render content to JSON bytes."""
+        if HAS_ORJSON:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return super().render(content)
+
+
 class EventDrivenMatchProcessor:
     """Event-driven match processor with webhook endpoints."""
 
@@ -45,6 +68,15 @@ class EventDrivenMatchProcessor:
         self.storage_service = GoogleDriveStorageService()
         self.health_service = HealthService(settings)
 
+        # Dependencies are probed at most once per TTL; concurrent polls share a refresh
+        try:
+            self._health_ttl = float(os.environ.get("HEALTH_TTL", "5"))
+        except ValueError:
+            logger.warning(f"Invalid HEALTH_TTL {os.environ['HEALTH_TTL']!r}, using 5 seconds")
+            self._health_ttl = 5.0
+        self._health_cache: Optional[Tuple[float, Dict[str, DependencyStatus]]] = None
+        self._health_refresh: Optional["asyncio.Future[Dict[str, DependencyStatus]]"] = None
+
         # Webhook processing service
         self.webhook_service = WebhookProcessingService()
 
@@ -55,15 +87,15 @@ class EventDrivenMatchProcessor:
             generate_whatsapp_description,
         )
 
-        # Processing state
+        # Processing state, only read and written on the event loop thread
         self.processing = False
         self.processing_count = 0
         self.last_processing_time: Optional[float] = None
-        self.processing_lock = threading.Lock()
 
         # Server configuration
         self.port = int(os.environ.get("PORT", "8000"))
         self.host = os.environ.get("HOST", "0.0.0.0")  # nosec B104
+        self.access_log = os.environ.get("ACCESS_LOG", "false").lower() == "true"
 
         # Create FastAPI app
         self.app = self._create_app()
@@ -94,12 +126,13 @@ class EventDrivenMatchProcessor:
             description="Event-driven match list processor with webhook processing",
             version="2.0.0",
             lifespan=lifespan,
+            default_response_class=FastJSONResponse,
         )
 
         @app.get("/")
         async def root() -> JSONResponse:
             """Service information endpoint."""
-            return JSONResponse(
+            return FastJSONResponse(
                 content={
                     "service_name": "match-list-processor",
                     "version": "2.0.0",
@@ -116,7 +149,7 @@ class EventDrivenMatchProcessor:
             """Enhanced health check with processing status."""
             try:
                 # Get dependency health status
-                health_status = await self.health_service.get_health_status()
+                health_status = await self._get_health_status()
 
                 # Convert dependencies to dict for JSON serialization
                 dependencies_dict = {}
@@ -132,7 +165,7 @@ class EventDrivenMatchProcessor:
                         ),
                     }
 
-                return JSONResponse(
+                return FastJSONResponse(
                     content={
                         "service_name": "match-list-processor",
                         "status": health_status.status,
@@ -146,7 +179,7 @@ class EventDrivenMatchProcessor:
                 )
             except Exception as e:
                 logger.error(f"Health check failed: {e}")
-                return JSONResponse(
+                return FastJSONResponse(
                     status_code=503,
                     content={
                         "service_name": "match-list-processor",
@@ -159,30 +192,30 @@ class EventDrivenMatchProcessor:
         @app.get("/health/simple")
         async def simple_health_check() -> JSONResponse:
             """Simple health check for basic monitoring."""
-            return JSONResponse(content={"status": "healthy"})
+            return FastJSONResponse(content={"status": "healthy"})
 
         @app.post("/process")
         async def process_webhook(background_tasks: BackgroundTasks) -> JSONResponse:
             """Webhook endpoint to trigger match processing."""
-            # Check if already processing
-            with self.processing_lock:
-                if self.processing:
-                    return JSONResponse(
-                        status_code=429,
-                        content={
-                            "status": "busy",
-                            "message": "Processing already in progress",
-                            "processing_count": self.webhook_service.processing_count,
-                        },
-                    )
-
-                # Mark as processing
-                self.processing = True
+            # Check if already processing. There is no await between the check and
+            # the update, so the event loop makes this admission atomic.
+            if self.processing:
+                return FastJSONResponse(
+                    status_code=429,
+                    content={
+                        "status": "busy",
+                        "message": "Processing already in progress",
+                        "processing_count": self.webhook_service.processing_count,
+                    },
+                )
+
+            # Mark as processing
+            self.processing = True
 
             # Start background processing
             background_tasks.add_task(self._process_matches_background)
 
-            return JSONResponse(
+            return FastJSONResponse(
                 content={
                     "status": "success",
                     "message": "Match processing triggered",
@@ -195,24 +228,49 @@ class EventDrivenMatchProcessor:
             """Get current processing status and metrics."""
             status = self.webhook_service.get_processing_status()
             status["currently_processing"] = self.processing
-            return JSONResponse(content=status)
+            return FastJSONResponse(content=status)
 
         @app.get("/status/detailed")
         async def detailed_processing_status() -> JSONResponse:
             """Get detailed processing status with full history."""
             status = self.webhook_service.get_detailed_status()
             status["currently_processing"] = self.processing
-            return JSONResponse(content=status)
+            return FastJSONResponse(content=status)
 
         @app.get("/metrics")
         async def processing_metrics() -> JSONResponse:
             """Get processing performance metrics."""
             metrics = self.webhook_service.get_processing_metrics()
             metrics["currently_processing"] = self.processing
-            return JSONResponse(content=metrics)
+            return FastJSONResponse(content=metrics)
 
         return app
 
+    async def _get_health_status(self) -> HealthStatus:
+        """Return the current health status, reusing dependency probes within the TTL."""
+        return self.health_service.build_health_status(await self._get_dependency_statuses())
+
+    async def _get_dependency_statuses(self) -> Dict[str, DependencyStatus]:
+        """Return the cached dependency statuses, refreshing them once the TTL has expired."""
+        if self._health_cache is not None:
+            checked_at, dependencies = self._health_cache
+            if time.monotonic() - checked_at < self._health_ttl:
+                return dependencies
+
+        if self._health_refresh is None:
+            self._health_refresh = asyncio.ensure_future(self._refresh_dependency_statuses())
+        # Shield the shared refresh so one cancelled request does not cancel it for the others
+        return await asyncio.shield(self._health_refresh)
+
+    async def _refresh_dependency_statuses(self) -> Dict[str, DependencyStatus]:
+        """Probe dependencies and cache the results."""
+        try:
+            dependencies = await self.health_service.check_all_dependencies()
+            self._health_cache = (time.monotonic(), dependencies)
+            return dependencies
+        finally:
+            self._health_refresh = None
+
     async def _process_matches_background(self) -> None:
         """Process matches in background thread."""
         try:
@@ -223,9 +281,8 @@ class EventDrivenMatchProcessor:
             logger.error(f"Background processing failed: {e}")
             logger.exception("Stack trace:")
         finally:
-            # Always reset processing state
-            with self.processing_lock:
-                self.processing = False
+            # Always reset processing state (back on the event loop thread)
+            self.processing = False
 
     def _process_matches_sync(self) -> None:
         """Synchronous match processing logic."""
@@ -251,8 +308,10 @@ class EventDrivenMatchProcessor:
             app=self.app,
             host=self.host,
             port=self.port,
+            loop="uvloop" if HAS_UVLOOP else "asyncio",
+            http="auto",  # httptools when installed, h11 otherwise
             log_level="info",
-            access_log=True,
+            access_log=self.access_log,
         )
 
         self.server = uvicorn.Server(config)
@@ -269,8 +328,11 @@ class EventDrivenMatchProcessor:
         logger.info("Starting event-driven match list processor...")
 
         try:
-            # Run the async server
-            asyncio.run(self.run_server())
+            # Run the async server, on uvloop when it is available
+            if HAS_UVLOOP:
+                uvloop.run(self.run_server())
+            else:
+                asyncio.run(self.run_server())
         except KeyboardInterrupt:
             logger.info("Received keyboard interrupt, shutting down...")
         except Exception as e:
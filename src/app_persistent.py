@@ -1,6 +1,5 @@
 """Main application orchestrator for match list processing with persistent service mode support."""
 
-import json
 import logging
 import os
 import signal
@@ -11,7 +10,7 @@ from typing import Optional
 
 # Import the original app components
 from src.config import settings
-from src.core.data_manager import MatchDataManager
+from src.core.data_manager import MatchDataManager, serialize_matches
 from src.core.match_comparator import MatchComparator
 from src.core.match_processor import MatchProcessor
 from src.custom_types import MatchDict_Dict
@@ -72,10 +71,8 @@ class PersistentMatchListProcessorApp:
         logger.info("Starting health server on port 8000...")
         self.health_server.start_server()
 
-        # Give health server time to start
-        time.sleep(2)
-
-        if not self.health_server.is_running():
+        # Wait for the health server to come up instead of sleeping a fixed 2 seconds
+        if not self.health_server.wait_until_ready(timeout=2.0):
             logger.warning("Health server failed to start, but continuing with main processing...")
 
         if self.run_mode == "service":
@@ -215,33 +212,29 @@ class PersistentMatchListProcessorApp:
         """Process modified matches."""
         if common_ids:
             logger.info(f"Checking for MODIFIED matches among {len(common_ids)} common matches...")
-            modified_count = 0
-
-            for match_id in common_ids:
-                prev_match = previous_matches[match_id]
-                curr_match = current_matches[match_id]
+            modified = MatchComparator.find_modified_matches(
+                previous_matches, current_matches, common_ids
+            )
 
-                if MatchComparator.is_match_modified(prev_match, curr_match):
-                    modified_count += 1
-                    self.match_processor.process_match(
-                        curr_match,
-                        match_id,
-                        is_new=False,
-                        previous_match_data=prev_match,
-                    )
+            for match_id, prev_match, curr_match in modified:
+                self.match_processor.process_match(
+                    curr_match,
+                    match_id,
+                    is_new=False,
+                    previous_match_data=prev_match,
+                )
 
             logger.info(
-                f"Found {modified_count} modified matches out of {len(common_ids)} common matches."
+                f"Found {len(modified)} modified matches out of {len(common_ids)} common matches."
             )
         else:
             logger.info("No common matches found between previous and current lists.")
 
     def _save_current_matches(self, current_matches: MatchDict_Dict) -> None:
         """Save current matches for future comparison."""
-        # Convert back to list format for JSON serialization
-        current_matches_list = list(current_matches.values())
-        raw_json_string = json.dumps(current_matches_list, ensure_ascii=False)
-        self.data_manager.save_current_matches_raw_json(raw_json_string)
+        # Serialize straight to UTF-8 bytes; the file is written without a str copy
+        raw_json = serialize_matches(list(current_matches.values()))
+        self.data_manager.save_current_matches_raw_json(raw_json)
         logger.info("Current matches saved as raw JSON for future comparison.")
 
 
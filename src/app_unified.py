@@ -85,10 +85,8 @@ class UnifiedMatchListProcessorApp:
             logger.info("Starting health server on port 8000...")
             self.health_server.start_server()
 
-            # Give health server time to start
-            time.sleep(2)
-
-            if self.health_server and not self.health_server.is_running():
+            # Wait for the health server to come up instead of sleeping a fixed 2 seconds
+            if not self.health_server.wait_until_ready(timeout=2.0):
                 logger.warning(
                     "Health server failed to start, but continuing with main processing..."
                 )
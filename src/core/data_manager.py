@@ -3,14 +3,28 @@
 import json
 import logging
 import os
-from typing import Optional, cast
+from typing import Optional, Union, cast
 
 from ..config import settings
 from ..custom_types import MatchList
 
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
 
+def serialize_matches(matches: MatchList) -> bytes:
+    """Serialize a match list to compact UTF-8 JSON, with orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.dumps(matches)
+    return json.dumps(matches, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
 class MatchDataManager:
     """Manages loading and saving of match data."""
 
@@ -60,7 +74,8 @@ class MatchDataManager:
             return []
 
         try:
-            previous_matches_list = json.loads(raw_json_string)
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so both are caught below
+            previous_matches_list = (orjson.loads if HAS_ORJSON else json.loads)(raw_json_string)
             first_three_ids = (
                 [match["matchid"] for match in previous_matches_list[:3]]
                 if previous_matches_list
@@ -75,22 +90,30 @@ class MatchDataManager:
             logger.error(f"Error decoding JSON string: {e}. Starting fresh with empty data.")
             return []
 
-    def save_current_matches_raw_json(self, raw_json_string: str) -> None:
+    def save_current_matches_raw_json(self, raw_json_string: Union[str, bytes]) -> None:
         """Save the current match list as RAW JSON STRING to file.
 
         Args:
-            raw_json_string: Raw JSON string to save
+            raw_json_string: Raw JSON string to save, or UTF-8 encoded JSON bytes
         """
         os.makedirs(self.data_folder, exist_ok=True)
 
         try:
-            logger.debug(
-                f"Saving current matches as raw JSON string (first 50 chars): "
-                f"{raw_json_string[:50]}..."
-            )
-
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                f.write(raw_json_string)
+            if isinstance(raw_json_string, bytes):
+                logger.debug(
+                    f"Saving current matches as raw JSON bytes (first 50 bytes): "
+                    f"{raw_json_string[:50].decode('utf-8', 'replace')}..."
+                )
+                # Already encoded, e.g. by serialize_matches; write without a str round-trip
+                with open(self.file_path, "wb") as fb:
+                    fb.write(raw_json_string)
+            else:
+                logger.debug(
+                    f"Saving current matches as raw JSON string (first 50 chars): "
+                    f"{raw_json_string[:50]}..."
+                )
+                with open(self.file_path, "w", encoding="utf-8") as f:
+                    f.write(raw_json_string)
 
             logger.info(f"Current matches saved to {self.file_path} as raw JSON.")
         except Exception as e:
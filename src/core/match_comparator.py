@@ -1,7 +1,7 @@
 """Match comparison and change detection logic."""
 
 import logging
-from typing import Set, Tuple
+from typing import Iterable, List, Set, Tuple
 
 from ..custom_types import MatchDict, MatchDict_Dict, MatchId, MatchList
 
@@ -36,15 +36,17 @@ class MatchComparator:
         Returns:
             Tuple of (new_match_ids, removed_match_ids, common_match_ids)
         """
-        previous_match_ids = set(previous_matches.keys())
-        current_match_ids = set(current_matches.keys())
+        # Set algebra on the keys views yields new sets without copying either key set first
+        previous_match_ids = previous_matches.keys()
+        current_match_ids = current_matches.keys()
 
         new_match_ids = current_match_ids - previous_match_ids
         removed_match_ids = previous_match_ids - current_match_ids
-        common_match_ids = current_match_ids.intersection(previous_match_ids)
+        common_match_ids = current_match_ids & previous_match_ids
 
-        logger.debug(f"Keys of current_matches dictionary: {list(current_matches.keys())}")
-        logger.debug(f"Keys of previous_matches dictionary: {list(previous_matches.keys())}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Keys of current_matches dictionary: {list(current_match_ids)}")
+            logger.debug(f"Keys of previous_matches dictionary: {list(previous_match_ids)}")
 
         return new_match_ids, removed_match_ids, common_match_ids
 
@@ -88,6 +90,29 @@ class MatchComparator:
 
         return False
 
+    @staticmethod
+    def find_modified_matches(
+        previous_matches: MatchDict_Dict,
+        current_matches: MatchDict_Dict,
+        match_ids: Iterable[MatchId],
+    ) -> List[Tuple[MatchId, MatchDict, MatchDict]]:
+        """Pair up the given matches and keep only those that were modified.
+
+        Args:
+            previous_matches: Dictionary of previous matches
+            current_matches: Dictionary of current matches
+            match_ids: IDs present in both dictionaries, e.g. the common IDs from detect_changes
+
+        Returns:
+            List of (match_id, previous_match, current_match) for modified matches
+        """
+        pairs = ((i, previous_matches[i], current_matches[i]) for i in match_ids)
+        return [
+            (match_id, previous, current)
+            for match_id, previous, current in pairs
+            if MatchComparator.is_match_modified(previous, current)
+        ]
+
     @staticmethod
     def get_modification_details(previous_match: MatchDict, current_match: MatchDict) -> list:
         """Get detailed list of modifications between two matches.
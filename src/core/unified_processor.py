@@ -250,21 +250,19 @@ class UnifiedMatchProcessor:
                         )
 
             # Process updated matches
-            for match_id in common_match_ids:
-                previous_match = previous_matches_dict[match_id]
-                current_match = current_matches_dict[match_id]
-
-                if MatchComparator.is_match_modified(previous_match, current_match):
-                    logger.info(f"Processing updated match {match_id}")
-                    result = self.match_processor.process_match(
-                        current_match, match_id, is_new=False, previous_match_data=previous_match
+            for match_id, previous_match, current_match in MatchComparator.find_modified_matches(
+                previous_matches_dict, current_matches_dict, common_match_ids
+            ):
+                logger.info(f"Processing updated match {match_id}")
+                result = self.match_processor.process_match(
+                    current_match, match_id, is_new=False, previous_match_data=previous_match
+                )
+                if result and result.get("success"):
+                    logger.info(f"Successfully processed updated match {match_id}")
+                else:
+                    logger.error(
+                        f"Failed to process updated match {match_id}: {result.get('error_message') if result else 'Unknown error'}"
                     )
-                    if result and result.get("success"):
-                        logger.info(f"Successfully processed updated match {match_id}")
-                    else:
-                        logger.error(
-                            f"Failed to process updated match {match_id}: {result.get('error_message') if result else 'Unknown error'}"
-                        )
 
             # Save processed matches
             import json
@@ -3,7 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import Optional, Tuple
 
-from .custom_types import FilePath, MatchList, UploadResult
+from .custom_types import FilePath, MatchDict_Dict, MatchList, UploadResult
 
 
 class ApiClientInterface(ABC):
@@ -18,6 +18,21 @@ class ApiClientInterface(ABC):
         """
         pass
 
+    def fetch_matches_dict(self) -> MatchDict_Dict:
+        """Fetch matches from the API keyed by match ID.
+
+        Returns:
+            Dictionary with match IDs as keys and match data as values,
+            empty when the API returned no matches or an unusable payload.
+        """
+        # Clients may hand back an unvalidated payload, e.g. None for a JSON null body
+        payload: Optional[MatchList] = self.fetch_matches_list()
+
+        if not isinstance(payload, list):
+            return {}
+
+        return {int(match["matchid"]): match for match in payload}
+
 
 class AvatarServiceInterface(ABC):
     """Abstract interface for avatar creation services."""
@@ -181,7 +181,10 @@ class HealthService:
 
     async def get_health_status(self) -> HealthStatus:
         """Get comprehensive health status of the service."""
-        dependencies = await self.check_all_dependencies()
+        return self.build_health_status(await self.check_all_dependencies())
+
+    def build_health_status(self, dependencies: Dict[str, DependencyStatus]) -> HealthStatus:
+        """Build the health status for already-probed dependencies, with current uptime."""
         overall_status = self._determine_overall_status(dependencies)
         uptime = time.time() - self.start_time
 
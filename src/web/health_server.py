@@ -3,6 +3,7 @@
 import asyncio
 import logging
 import threading
+import time
 from contextlib import asynccontextmanager
 from typing import Any, Dict, Optional
 
@@ -183,6 +184,15 @@ class HealthServer:
         """Check if the health server is running."""
         return bool(self.server_thread and self.server_thread.is_alive())
 
+    def wait_until_ready(self, timeout: float = 2.0, interval: float = 0.01) -> bool:
+        """Wait until the server accepts connections, it stops, or `timeout` elapses."""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline and self.is_running():
+            if self._server is not None and self._server.started:
+                return True
+            time.sleep(interval)
+        return self.is_running()
+
 
 def create_health_server(settings: Settings, port: int = 8000) -> HealthServer:
     """Factory function to create a health server instance."""
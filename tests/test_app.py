@@ -1,7 +1,10 @@
 """Tests for the main application."""
 
+import signal
 from unittest.mock import Mock, patch
 
+import pytest
+
 from src.app import MatchListProcessorApp, main, setup_logging
 
 
@@ -11,10 +14,9 @@ class TestMatchListProcessorApp:
     def test_fetch_current_matches(self, sample_matches_list):
         """Test fetching current matches."""
         app = MatchListProcessorApp()
-        app.api_client = Mock()
-        app.api_client.fetch_matches_list.return_value = sample_matches_list
 
-        result = app._fetch_current_matches()
+        with patch.object(app.api_client, "fetch_matches_list", return_value=sample_matches_list):
+            result = app._fetch_current_matches()
 
         assert len(result) == 2
         assert 6169105 in result
@@ -23,10 +25,18 @@ class TestMatchListProcessorApp:
     def test_fetch_current_matches_empty(self):
         """Test fetching current matches when empty."""
         app = MatchListProcessorApp()
-        app.api_client = Mock()
-        app.api_client.fetch_matches_list.return_value = []
 
-        result = app._fetch_current_matches()
+        with patch.object(app.api_client, "fetch_matches_list", return_value=[]):
+            result = app._fetch_current_matches()
+
+        assert result == {}
+
+    def test_fetch_current_matches_none_payload(self):
+        """Test fetching current matches when the API returns a null payload."""
+        app = MatchListProcessorApp()
+
+        with patch.object(app.api_client, "fetch_matches_list", return_value=None):
+            result = app._fetch_current_matches()
 
         assert result == {}
 
@@ -123,6 +133,31 @@ class TestMatchListProcessorApp:
 
         app.data_manager.save_current_matches_raw_json.assert_called_once()
 
+    def test_shutdown_is_idempotent(self):
+        """Test that repeated shutdown calls stop the health server only once."""
+        app = MatchListProcessorApp()
+        app.health_server = Mock()
+
+        app.shutdown()
+        app.shutdown()
+
+        app.health_server.stop_server.assert_called_once()
+
+    def test_signal_during_run_stops_health_server_once(self):
+        """Test that a shutdown signal unwinds run() and cleans up in its finally block."""
+        app = MatchListProcessorApp()
+        app.health_server = Mock()
+
+        def interrupt():
+            app._signal_handler(signal.SIGTERM, None)
+
+        with patch.object(app, "_load_previous_matches", side_effect=interrupt):
+            with pytest.raises(SystemExit) as exc_info:
+                app.run()
+
+        assert exc_info.value.code == 0
+        app.health_server.stop_server.assert_called_once()
+
 
 class TestSetupLogging:
     """Test logging setup."""
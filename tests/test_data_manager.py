@@ -2,8 +2,9 @@
 
 import json
 import os
+from unittest.mock import patch
 
-from src.core.data_manager import MatchDataManager
+from src.core.data_manager import MatchDataManager, serialize_matches
 
 
 class TestMatchDataManager:
@@ -100,6 +101,30 @@ class TestMatchDataManager:
             saved_data = f.read()
         assert saved_data == raw_json
 
+    def test_save_serialized_matches_round_trip(self, temp_data_dir, sample_matches_list):
+        """Test that bytes from serialize_matches are saved and parse back unchanged."""
+        manager = MatchDataManager(temp_data_dir, "output.json")
+
+        manager.save_current_matches_raw_json(serialize_matches(sample_matches_list))
+
+        raw_json = manager.load_previous_matches_raw_json()
+        assert manager.parse_raw_json_to_list(raw_json) == sample_matches_list
+
+    def test_serialize_matches_without_orjson(self, temp_data_dir, sample_matches_list):
+        """Test the stdlib fallback writes the same compact bytes and parses back unchanged."""
+        manager = MatchDataManager(temp_data_dir, "output.json")
+
+        with patch("src.core.data_manager.HAS_ORJSON", False):
+            serialized = serialize_matches(sample_matches_list)
+            manager.save_current_matches_raw_json(serialized)
+            raw_json = manager.load_previous_matches_raw_json()
+            parsed = manager.parse_raw_json_to_list(raw_json)
+
+        expected = json.dumps(sample_matches_list, ensure_ascii=False, separators=(",", ":"))
+        assert serialized == expected.encode("utf-8")
+        assert serialized == serialize_matches(sample_matches_list)
+        assert parsed == sample_matches_list
+
     def test_save_current_matches_raw_json_creates_directory(self, temp_data_dir):
         """Test that saving creates the data directory if it doesn't exist."""
         nested_dir = os.path.join(temp_data_dir, "nested", "path")
@@ -1,14 +1,15 @@
 """Tests for event-driven architecture and webhook processing."""
 
+import asyncio
 import os
 import tempfile
 import time
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from fastapi.testclient import TestClient
 
-from src.app_event_driven import EventDrivenMatchProcessor
+from src.app_event_driven import EventDrivenMatchProcessor, FastJSONResponse
 from src.services.webhook_service import WebhookProcessingService
 
 
@@ -172,6 +173,69 @@ class TestEventDrivenApp(unittest.TestCase):
         self.assertIn("status", data)
         self.assertEqual(data["mode"], "event-driven")
 
+    def test_health_status_cached_within_ttl(self):
+        """Test dependency probes are reused until the health TTL expires."""
+        with patch.object(
+            self.processor.health_service,
+            "check_all_dependencies",
+            new_callable=AsyncMock,
+            return_value={},
+        ) as mock_check:
+            self.client.get("/health")
+            self.client.get("/health")
+            self.assertEqual(mock_check.await_count, 1)
+
+            self.processor._health_ttl = 0
+            self.client.get("/health")
+            self.assertEqual(mock_check.await_count, 2)
+
+    def test_cached_health_status_has_current_uptime(self):
+        """Test uptime and timestamp are rebuilt per request while probes are cached."""
+
+        async def poll_twice():
+            first = await self.processor._get_health_status()
+            await asyncio.sleep(0.01)
+            return first, await self.processor._get_health_status()
+
+        with patch.object(
+            self.processor.health_service,
+            "check_all_dependencies",
+            new_callable=AsyncMock,
+            return_value={},
+        ) as mock_check:
+            first, second = asyncio.run(poll_twice())
+
+        mock_check.assert_awaited_once()
+        self.assertGreater(second.uptime_seconds, first.uptime_seconds)
+        self.assertGreater(second.timestamp, first.timestamp)
+
+    def test_concurrent_health_checks_share_one_refresh(self):
+        """Test concurrent health requests coalesce onto a single dependency probe."""
+
+        async def slow_check():
+            await asyncio.sleep(0.01)
+            return {}
+
+        async def poll_concurrently():
+            return await asyncio.gather(
+                *(self.processor._get_dependency_statuses() for _ in range(5))
+            )
+
+        with patch.object(
+            self.processor.health_service, "check_all_dependencies", side_effect=slow_check
+        ) as mock_check:
+            results = asyncio.run(poll_concurrently())
+
+        mock_check.assert_called_once()
+        self.assertEqual(len({id(result) for result in results}), 1)
+
+    def test_invalid_health_ttl_falls_back_to_default(self):
+        """Test a malformed HEALTH_TTL does not stop the processor from starting."""
+        with patch.dict(os.environ, {"HEALTH_TTL": "five"}):
+            processor = EventDrivenMatchProcessor()
+
+        self.assertEqual(processor._health_ttl, 5.0)
+
     def test_simple_health_endpoint(self):
         """Test simple health check endpoint."""
         response = self.client.get("/health/simple")
@@ -243,6 +307,28 @@ class TestEventDrivenApp(unittest.TestCase):
         data = response2.json()
         self.assertEqual(data["status"], "busy")
 
+    def test_fast_json_response_matches_stdlib_rendering(self):
+        """Test the orjson-backed response renders the same bytes as JSONResponse."""
+        content = {"status": "healthy", "count": 3, "name": "Kongahälla", "by_id": {1: True}}
+
+        with patch("src.app_event_driven.HAS_ORJSON", False):
+            expected = FastJSONResponse(content=content).body
+
+        self.assertEqual(FastJSONResponse(content=content).body, expected)
+
+    def test_access_log_disabled_by_default(self):
+        """Test uvicorn access logging is opt-in via ACCESS_LOG."""
+        self.assertFalse(self.processor.access_log)
+
+    @patch("src.app_event_driven.HAS_UVLOOP", True)
+    @patch("src.app_event_driven.uvloop", create=True)
+    def test_run_uses_uvloop_when_available(self, mock_uvloop):
+        """Test the server coroutine runs on uvloop when it is installed."""
+        with patch.object(self.processor, "run_server", MagicMock()) as mock_run_server:
+            self.processor.run()
+
+        mock_uvloop.run.assert_called_once_with(mock_run_server.return_value)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -269,6 +269,21 @@ class TestHealthServerLifecycle:
         finally:
             health_server.stop_server()
 
+    def test_wait_until_ready(self, health_server):
+        """Test waiting for the server returns once it accepts connections."""
+        try:
+            health_server.start_server()
+
+            assert health_server.wait_until_ready(timeout=5.0)
+            assert health_server._server.started
+
+        finally:
+            health_server.stop_server()
+
+    def test_wait_until_ready_when_not_started(self, health_server):
+        """Test waiting for a server that was never started returns immediately."""
+        assert not health_server.wait_until_ready(timeout=5.0)
+
     def test_stop_server(self, health_server):
         """Test stopping the health server."""
         health_server.start_server()
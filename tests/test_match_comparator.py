@@ -118,6 +118,18 @@ class TestMatchComparator:
         result = MatchComparator.is_match_modified(sample_match_data, modified_match)
         assert result is True
 
+    def test_find_modified_matches(self, sample_match_data):
+        """Test that only modified common matches are returned with both versions."""
+        unchanged = {**sample_match_data, "matchid": 1}
+        previous = {**sample_match_data, "matchid": 2}
+        current = {**previous, "tid": "2025-06-14T16:00:00"}
+
+        result = MatchComparator.find_modified_matches(
+            {1: unchanged, 2: previous}, {1: unchanged, 2: current}, {1, 2}
+        )
+
+        assert result == [(2, previous, current)]
+
     def test_get_modification_details_time_change(self, sample_match_data):
         """Test getting modification details for time change."""
         modified_match = sample_match_data.copy()